@@ -19,25 +19,33 @@ Setup script for kerf development environment.
 
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
-def run_command(cmd, description):
-    """Run a command and handle errors."""
+def run_command(cmd, description, prefix="  "):
+    """Run a command (argv list, no shell), streaming its output as it arrives."""
     print(f"Running: {description}")
     try:
-        subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-        print(f"✓ {description} completed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        ) as proc:
+            for line in proc.stdout:
+                print(f"{prefix}{line}", end="", flush=True)
+            returncode = proc.wait()
+    except OSError as e:
+        # Without a shell, a missing executable surfaces here
         print(f"✗ {description} failed:")
         print(f"  Error: {e}")
-        if e.stdout:
-            print(f"  stdout: {e.stdout}")
-        if e.stderr:
-            print(f"  stderr: {e.stderr}")
         return False
 
+    if returncode != 0:
+        print(f"✗ {description} failed with exit status {returncode}")
+        return False
+
+    print(f"✓ {description} completed successfully")
+    return True
+
 
 def main():
     """Set up the development environment."""
@@ -51,30 +59,44 @@ def main():
 
     # Install dependencies
     print("\n1. Installing dependencies...")
-    if not run_command("pip install -e .", "Installing kerf in development mode"):
+    if not run_command(["pip", "install", "-e", "."], "Installing kerf in development mode"):
         return 1
 
     # Install development dependencies
     print("\n2. Installing development dependencies...")
-    cmd = "pip install pytest pytest-cov black flake8 mypy"
+    cmd = ["pip", "install", "pytest", "pytest-cov", "black", "flake8", "mypy"]
     if not run_command(cmd, "Installing dev dependencies"):
         return 1
 
-    # Run tests
-    print("\n3. Running tests...")
-    if not run_command("python -m pytest tests/", "Running test suite"):
-        return 1
-
-    # Check code formatting
-    print("\n4. Checking code formatting...")
-    if not run_command("black --check src/kerf/", "Checking code formatting"):
+    # Tests, formatting and linting are independent, so run them concurrently
+    print("\n3. Running tests, formatting and lint checks...")
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        # Tag each streamed line since the three outputs interleave
+        tests = executor.submit(
+            run_command,
+            ["python", "-m", "pytest", "tests/"],
+            "Running test suite",
+            "  [pytest] ",
+        )
+        formatting = executor.submit(
+            run_command,
+            ["black", "--check", "src/kerf/"],
+            "Checking code formatting",
+            "  [black] ",
+        )
+        linting = executor.submit(
+            run_command, ["flake8", "src/kerf/"], "Running flake8 linting", "  [flake8] "
+        )
+
+    if not formatting.result():
         print("  Note: Run 'black src/kerf/' to fix formatting issues")
 
-    # Run linting
-    print("\n5. Running linting...")
-    if not run_command("flake8 src/kerf/", "Running flake8 linting"):
+    if not linting.result():
         print("  Note: Fix linting issues before committing")
 
+    if not tests.result():
+        return 1
+
     print("\n" + "=" * 50)
     print("✓ Development environment setup complete!")
     print("\nNext steps:")
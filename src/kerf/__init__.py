@@ -19,33 +19,10 @@ A comprehensive multikernel management system designed to orchestrate
 and manage multiple kernel instances on a single host.
 """
 
-__version__ = "0.1.0"
-__author__ = "Cong Wang"
+import importlib
+import os
 
-# Export main runtime components for easy access
-from .runtime import DeviceTreeManager
-from .baseline import BaselineManager
-from .dtc.overlay import OverlayGenerator
-from .models import InstanceState
-from .exceptions import (
-    KerfError,
-    ValidationError,
-    ParseError,
-    ResourceConflictError,
-    ResourceExhaustionError,
-    InvalidReferenceError,
-    KernelInterfaceError,
-    ResourceError,
-)
-from .resources import (
-    get_available_cpus,
-    get_allocated_cpus,
-    get_allocated_memory_regions,
-    find_available_memory_base,
-    validate_cpu_allocation,
-    validate_memory_allocation,
-    find_next_instance_id,
-)
+__author__ = "Cong Wang"
 
 __all__ = [
     # Core classes
@@ -72,3 +49,59 @@ __all__ = [
     "validate_memory_allocation",
     "find_next_instance_id",
 ]
+
+# Public names are resolved on first access so that "import kerf" does not
+# pull in the device tree parser, validator and extractor.
+_LAZY = {
+    "DeviceTreeManager": ("kerf.runtime", "DeviceTreeManager"),
+    "BaselineManager": ("kerf.baseline", "BaselineManager"),
+    "OverlayGenerator": ("kerf.dtc.overlay", "OverlayGenerator"),
+    "InstanceState": ("kerf.models", "InstanceState"),
+    "KerfError": ("kerf.exceptions", "KerfError"),
+    "ValidationError": ("kerf.exceptions", "ValidationError"),
+    "ParseError": ("kerf.exceptions", "ParseError"),
+    "ResourceConflictError": ("kerf.exceptions", "ResourceConflictError"),
+    "ResourceExhaustionError": ("kerf.exceptions", "ResourceExhaustionError"),
+    "InvalidReferenceError": ("kerf.exceptions", "InvalidReferenceError"),
+    "KernelInterfaceError": ("kerf.exceptions", "KernelInterfaceError"),
+    "ResourceError": ("kerf.exceptions", "ResourceError"),
+    "get_available_cpus": ("kerf.resources", "get_available_cpus"),
+    "get_allocated_cpus": ("kerf.resources", "get_allocated_cpus"),
+    "get_allocated_memory_regions": ("kerf.resources", "get_allocated_memory_regions"),
+    "find_available_memory_base": ("kerf.resources", "find_available_memory_base"),
+    "validate_cpu_allocation": ("kerf.resources", "validate_cpu_allocation"),
+    "validate_memory_allocation": ("kerf.resources", "validate_memory_allocation"),
+    "find_next_instance_id": ("kerf.resources", "find_next_instance_id"),
+}
+
+
+def _version():
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("kerf")
+    except PackageNotFoundError:
+        # Running from a source tree without installed metadata
+        return "0.0.0+local"
+
+
+def __getattr__(name):
+    if name == "__version__":
+        value = _version()
+        globals()[name] = value
+        return value
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY) + ["__version__"])
+
+
+if os.environ.get("KERF_EAGER_IMPORT"):
+    for _name in _LAZY:
+        __getattr__(_name)
@@ -20,15 +20,42 @@ which contains only hardware resources and is set during system initialization.
 """
 
 import os
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from .dtc.parser import DeviceTreeParser
-from .dtc.extractor import InstanceExtractor
-from .dtc.validator import MultikernelValidator
 from .models import GlobalDeviceTree
 from .exceptions import ValidationError, ParseError, KernelInterfaceError
 
+if TYPE_CHECKING:
+    from .dtc.parser import DeviceTreeParser
+    from .dtc.extractor import InstanceExtractor
+    from .dtc.validator import MultikernelValidator
+
+
+@cache
+def _parser() -> "DeviceTreeParser":
+    """Return the shared DeviceTreeParser instance."""
+    from .dtc.parser import DeviceTreeParser
+
+    return DeviceTreeParser()
+
+
+@cache
+def _extractor() -> "InstanceExtractor":
+    """Return the shared InstanceExtractor instance."""
+    from .dtc.extractor import InstanceExtractor
+
+    return InstanceExtractor()
+
+
+@cache
+def _validator() -> "MultikernelValidator":
+    """Return the shared MultikernelValidator instance."""
+    from .dtc.validator import MultikernelValidator
+
+    return MultikernelValidator()
+
 
 class BaselineManager:
     """
@@ -48,6 +75,8 @@ class BaselineManager:
         validator: MultikernelValidator instance for validation
     """
 
+    __slots__ = ("baseline_path", "_cache")
+
     DEFAULT_BASELINE_PATH = "/sys/fs/multikernel/device_tree"
 
     def __init__(self, baseline_path: Optional[str] = None):
@@ -60,9 +89,33 @@ class BaselineManager:
         """
         self.baseline_path = Path(baseline_path or self.DEFAULT_BASELINE_PATH)
 
-        self.parser = DeviceTreeParser()
-        self.extractor = InstanceExtractor()
-        self.validator = MultikernelValidator()
+        # (stat key, parsed tree) of the last successful read_baseline()
+        self._cache = None
+
+    @property
+    def parser(self) -> "DeviceTreeParser":
+        """Shared DeviceTreeParser, created on first use."""
+        return _parser()
+
+    @property
+    def extractor(self) -> "InstanceExtractor":
+        """Shared InstanceExtractor, created on first use."""
+        return _extractor()
+
+    @property
+    def validator(self) -> "MultikernelValidator":
+        """Shared MultikernelValidator, created on first use."""
+        return _validator()
+
+    def clear_cache(self) -> None:
+        """
+        Drop the cached result of read_baseline().
+
+        The cache is keyed on the file's mtime and size, which kernfs may not
+        update when overlays are merged; callers that changed the device tree
+        through another path should call this before reading it again.
+        """
+        self._cache = None
 
     def validate_baseline(self, tree: GlobalDeviceTree) -> None:
         """
@@ -94,15 +147,19 @@ class BaselineManager:
         if not tree.hardware.memory:
             raise ValidationError("Baseline must contain memory allocation information")
 
-    def write_baseline(self, tree: GlobalDeviceTree) -> None:
+    def write_baseline(self, tree: GlobalDeviceTree, *, skip_full_validation: bool = False) -> None:
         """
         Write baseline device tree to kernel.
 
         Validates that the tree contains only resources (no instances) before writing.
         This is used for initial system setup via 'kerf init'.
 
+        The structural check (validate_baseline) always runs. The full resource
+        validation can be skipped by callers that have already validated the tree.
+
         Args:
             tree: GlobalDeviceTree containing only resources (no instances)
+            skip_full_validation: Skip MultikernelValidator validation of the tree
 
         Raises:
             ValidationError: If tree contains instances or invalid resources
@@ -112,11 +169,12 @@ class BaselineManager:
         self.validate_baseline(tree)
 
         # Validate resources are valid
-        validation_result = self.validator.validate(tree)
-        if not validation_result.is_valid:
-            error_msg = "Cannot write invalid baseline:\n"
-            error_msg += "\n".join(f"  - {err}" for err in validation_result.errors)
-            raise ValidationError(error_msg)
+        if not skip_full_validation:
+            validation_result = self.validator.validate(tree)
+            if not validation_result.is_valid:
+                error_msg = "Cannot write invalid baseline:\n"
+                error_msg += "\n".join(f"  - {err}" for err in validation_result.errors)
+                raise ValidationError(error_msg)
 
         # Generate DTB from model
         try:
@@ -125,11 +183,20 @@ class BaselineManager:
             raise KernelInterfaceError(f"Failed to generate baseline device tree blob: {e}") from e
 
         # The kernfs write operation is handled atomically by the kernel
+        self._cache = None
         try:
-            with open(self.baseline_path, "wb") as f:
-                f.write(dtb_data)
-                f.flush()
-                os.fsync(f.fileno())
+            # Hand the whole blob to the kernel in a single write() syscall
+            fd = os.open(self.baseline_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                written = os.write(fd, dtb_data)
+                if written != len(dtb_data):
+                    raise KernelInterfaceError(
+                        f"Short write to {self.baseline_path}: "
+                        f"{written} of {len(dtb_data)} bytes written"
+                    )
+                os.fsync(fd)
+            finally:
+                os.close(fd)
 
             if not self.baseline_path.exists():
                 raise KernelInterfaceError(
@@ -149,10 +216,35 @@ class BaselineManager:
                 f"Failed to write baseline to {self.baseline_path}: {e}"
             ) from e
 
+    def _read_file(self, size_hint: int) -> bytes:
+        """
+        Read the whole baseline file without a buffered reader.
+
+        Args:
+            size_hint: Expected file size (kernfs may report 0)
+
+        Returns:
+            File contents
+        """
+        fd = os.open(self.baseline_path, os.O_RDONLY)
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(fd, max(size_hint, 4096))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            return b"".join(chunks)
+        finally:
+            os.close(fd)
+
     def read_baseline(self) -> GlobalDeviceTree:
         """
         Read root device tree from kernel.
 
+        The parsed tree is cached and reused for as long as the file's mtime
+        and size are unchanged. Callers must not modify the returned tree.
+
         Returns:
             GlobalDeviceTree model representing current complete state
 
@@ -161,14 +253,19 @@ class BaselineManager:
             ParseError: If device tree cannot be parsed
         """
         try:
-            if not self.baseline_path.exists():
+            try:
+                st = os.stat(self.baseline_path)
+            except FileNotFoundError:
                 raise KernelInterfaceError(
                     f"Root device tree not found: {self.baseline_path}. "
                     "Initialize it first with 'kerf init'."
-                )
+                ) from None
+
+            key = (st.st_mtime_ns, st.st_size)
+            if self._cache is not None and self._cache[0] == key:
+                return self._cache[1]
 
-            with open(self.baseline_path, "rb") as f:
-                dtb_data = f.read()
+            dtb_data = self._read_file(st.st_size)
 
             if not dtb_data:
                 raise KernelInterfaceError(
@@ -176,6 +273,7 @@ class BaselineManager:
                 )
 
             tree = self.parser.parse_dtb_from_bytes(dtb_data)
+            self._cache = (key, tree)
 
             return tree
 
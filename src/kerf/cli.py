@@ -16,21 +16,81 @@
 Command-line interface for kerf.
 """
 
+import importlib
+import os
+
 import click
-from .load.main import load
-from .init.main import init
-from .create.main import create
-from .update.main import update
-from .exec.main import exec_cmd
-from .kill.main import kill_cmd
-from .unload.main import unload
-from .delete.main import delete
-from .show.main import show
-from .console.main import console
-
-
-@click.group()
-@click.version_option(version="0.1.0", prog_name="kerf")
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that imports subcommand modules only when dispatched.
+
+    Subcommands are registered as a mapping of command name to an import
+    path of the form ``"module:attribute"``. Setting ``KERF_EAGER_IMPORT=1``
+    resolves every subcommand up front so import errors surface early.
+    """
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+        if os.environ.get("KERF_EAGER_IMPORT"):
+            for cmd_name in self.lazy_subcommands:
+                self.get_command(None, cmd_name)
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name):
+        module_name, attr = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        cmd = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(cmd, click.Command):
+            raise ValueError(f"Lazy loading of {module_name}:{attr} did not return a click command")
+        return cmd
+
+
+def _print_version(ctx, param, value):  # pylint: disable=unused-argument
+    """Print the kerf version and exit, resolving it only when requested."""
+    if not value or ctx.resilient_parsing:
+        return
+
+    # kerf.__version__ falls back to a local version outside an install
+    from . import __version__
+
+    click.echo(f"kerf, version {__version__}")
+    ctx.exit()
+
+
+@click.group(
+    cls=LazyGroup,
+    context_settings={"help_option_names": ["-h", "--help"], "max_content_width": 100},
+    lazy_subcommands={
+        "init": "kerf.init.main:init",
+        "load": "kerf.load.main:load",
+        "create": "kerf.create.main:create",
+        "update": "kerf.update.main:update",
+        "exec": "kerf.exec.main:exec_cmd",
+        "kill": "kerf.kill.main:kill_cmd",
+        "unload": "kerf.unload.main:unload",
+        "delete": "kerf.delete.main:delete",
+        "show": "kerf.show.main:show",
+        "console": "kerf.console.main:console",
+    },
+)
+@click.option(
+    "--version",
+    is_flag=True,
+    expose_value=False,
+    is_eager=True,
+    callback=_print_version,
+    help="Show the version and exit.",
+)
 @click.option("--debug", is_flag=True, help="Enable debug mode")
 @click.pass_context
 def main(ctx, debug):
@@ -39,18 +99,5 @@ def main(ctx, debug):
     ctx.obj["debug"] = debug
 
 
-# Add subcommands
-main.add_command(init)
-main.add_command(load)
-main.add_command(create)
-main.add_command(update)
-main.add_command(exec_cmd)
-main.add_command(kill_cmd)
-main.add_command(unload)
-main.add_command(delete)
-main.add_command(show)
-main.add_command(console)
-
-
 if __name__ == "__main__":
     main()
@@ -17,21 +17,34 @@ Console attachment subcommand implementation for mktty device.
 """
 
 import os
-import select
+import re
 import sys
-import termios
-import tty
-from pathlib import Path
 from typing import Optional
 
 import click
 
-from ..models import InstanceState
-from ..utils import get_instance_id_from_name, get_instance_name_from_id, get_instance_status
-
 
 MKTTY_DEVICE = "/dev/mktty"
 CTRL_CLOSE_BRACKET = 0x1D  # Ctrl+]
+CTRL_CLOSE_BRACKET_BYTES = bytes([CTRL_CLOSE_BRACKET])
+STATUS_POLL_INTERVAL = 1.0  # seconds between instance status checks when idle
+
+# Bare \n not already preceded by \r
+_LF_NOT_CR = re.compile(rb"(?<!\r)\n")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to a possibly non-blocking fd."""
+    view = memoryview(data)
+    while view:
+        try:
+            written = os.write(fd, view)
+        except BlockingIOError:
+            import select
+
+            select.select([], [fd], [])
+            continue
+        view = view[written:]
 
 
 def run_console(instance_id: int, instance_name: str, verbose: bool = False) -> int:  # pylint: disable=unused-argument
@@ -46,8 +59,18 @@ def run_console(instance_id: int, instance_name: str, verbose: bool = False) ->
     Returns:
         0 on success, non-zero on error
     """
+    # Terminal and polling modules are only needed once actually attaching
+    import select
+    import termios
+    import tty
+
+    from ..models import InstanceState
+    from ..utils import get_instance_status
+
     # Check if mktty device exists
-    if not Path(MKTTY_DEVICE).exists():
+    try:
+        os.stat(MKTTY_DEVICE)
+    except FileNotFoundError:
         click.echo(f"Error: Console device {MKTTY_DEVICE} not found", err=True)
         click.echo("Make sure the mktty kernel module is loaded", err=True)
         return 1
@@ -72,13 +95,16 @@ def run_console(instance_id: int, instance_name: str, verbose: bool = False) ->
 
     try:
         # Write instance ID to mktty device to initiate connection
-        instance_id_str = f"{instance_id}\n"
-        os.write(mktty_fd, instance_id_str.encode("utf-8"))
+        os.write(mktty_fd, b"%d\n" % instance_id)
+
+        # Reads are drained until EAGAIN; writes go through _write_all()
+        os.set_blocking(mktty_fd, False)
 
         # Save terminal settings
         stdin_fd = sys.stdin.fileno()
         stdout_fd = sys.stdout.fileno()
         old_settings = termios.tcgetattr(stdin_fd)
+        ep = None
 
         try:
             # Enter raw mode
@@ -86,72 +112,102 @@ def run_console(instance_id: int, instance_name: str, verbose: bool = False) ->
 
             # State for detach sequence detection
             saw_ctrl_bracket = False
-            idle_polls = 0
+            active = InstanceState.ACTIVE.value
+
+            # Register both fds once; the poll timeout doubles as the
+            # interval for checking that the instance is still active.
+            ep = select.epoll()
+            ep.register(stdin_fd, select.EPOLLIN)
+            ep.register(mktty_fd, select.EPOLLIN)
 
             # I/O loop
             while True:
-                readable, _, _ = select.select([stdin_fd, mktty_fd], [], [], 0.1)
-
-                if not readable:
-                    # Idle: periodically check that the instance is still
-                    # active so the console exits when the spawn halts.
-                    idle_polls += 1
-                    if idle_polls >= 10:
-                        idle_polls = 0
-                        status = get_instance_status(instance_name)
-                        if status is None or status.lower() != InstanceState.ACTIVE.value:
-                            os.write(
-                                stdout_fd,
-                                "\r\nInstance '{}' is no longer active (status: {}).\r\n".format(
-                                    instance_name, status
-                                ).encode("utf-8"),
-                            )
-                            return 0
+                events = ep.poll(STATUS_POLL_INTERVAL)
+
+                if not events:
+                    # Idle: check that the instance is still active so the
+                    # console exits when the spawn halts.
+                    status = get_instance_status(instance_name)
+                    if status is None or status.casefold() != active:
+                        os.write(
+                            stdout_fd,
+                            "\r\nInstance '{}' is no longer active (status: {}).\r\n".format(
+                                instance_name, status
+                            ).encode("utf-8"),
+                        )
+                        return 0
                     continue
 
-                idle_polls = 0
-                for fd in readable:
+                for fd, event_mask in events:
                     if fd == stdin_fd:
-                        # Read from stdin
-                        data = os.read(stdin_fd, 1)
+                        # Read from stdin, a whole block at a time so pasted
+                        # input is forwarded with one write per span
+                        data = os.read(stdin_fd, 4096)
                         if not data:
                             # EOF on stdin
                             return 0
 
-                        byte = data[0]
-
-                        # Check for detach sequence: Ctrl+] followed by .
-                        if saw_ctrl_bracket:
-                            if byte == ord('.'):
-                                # Detach sequence complete
-                                return 0
-                            # Not a detach sequence, send the buffered Ctrl+]
-                            os.write(mktty_fd, bytes([CTRL_CLOSE_BRACKET]))
-                            saw_ctrl_bracket = False
-                            # Fall through to send current byte
-
-                        if byte == CTRL_CLOSE_BRACKET:
+                        i = 0
+                        while i < len(data):
+                            # Check for detach sequence: Ctrl+] followed by .
+                            # (the Ctrl+] may have ended the previous block)
+                            if saw_ctrl_bracket:
+                                saw_ctrl_bracket = False
+                                if data[i] == ord('.'):
+                                    # Detach sequence complete
+                                    return 0
+                                # Not a detach sequence, send the buffered Ctrl+]
+                                _write_all(mktty_fd, CTRL_CLOSE_BRACKET_BYTES)
+                                continue
+
+                            idx = data.find(CTRL_CLOSE_BRACKET_BYTES, i)
+                            if idx == -1:
+                                # Send the rest of the block to mktty device
+                                _write_all(mktty_fd, data[i:])
+                                break
+
+                            if idx > i:
+                                _write_all(mktty_fd, data[i:idx])
                             # Start of potential detach sequence
                             saw_ctrl_bracket = True
-                        else:
-                            # Send to mktty device
-                            os.write(mktty_fd, data)
+                            i = idx + 1
 
                     elif fd == mktty_fd:
-                        # Read from mktty device
+                        # Drain everything the device has buffered so a burst
+                        # of output is translated and written in one go
+                        chunks = []
+                        eof = False
                         try:
-                            data = os.read(mktty_fd, 4096)
-                            if data:
-                                # Translate \n to \r\n for proper terminal display
-                                # in raw mode (kernel outputs \n, terminal needs \r\n)
-                                # First normalize any existing \r\n to \n, then convert
-                                data = data.replace(b'\r\n', b'\n').replace(b'\n', b'\r\n')
-                                os.write(stdout_fd, data)
+                            while True:
+                                chunk = os.read(mktty_fd, 65536)
+                                if not chunk:
+                                    eof = True
+                                    break
+                                chunks.append(chunk)
+                        except BlockingIOError:
+                            # Drained; a spurious wakeup may find no data
+                            pass
                         except OSError:
                             # Device closed or error
                             return 0
 
+                        if chunks:
+                            # Translate \n to \r\n for proper terminal display
+                            # in raw mode (kernel outputs \n, terminal needs \r\n),
+                            # leaving existing \r\n pairs untouched
+                            data = _LF_NOT_CR.sub(b'\r\n', b''.join(chunks))
+                            os.write(stdout_fd, data)
+
+                        if eof:
+                            # Device reached end of file
+                            return 0
+                        if not chunks and event_mask & (select.EPOLLHUP | select.EPOLLERR):
+                            # Device hung up with nothing left to read
+                            return 0
+
         finally:
+            if ep is not None:
+                ep.close()
             # Restore terminal settings
             termios.tcsetattr(stdin_fd, termios.TCSADRAIN, old_settings)
             click.echo("")
@@ -181,6 +237,9 @@ def console(name: Optional[str], id: Optional[int], verbose: bool):
         kerf console web-server
         kerf console --id=1
     """
+    from ..models import InstanceState
+    from ..utils import get_instance_id_from_name, get_instance_name_from_id, get_instance_status
+
     try:
         if not name and id is None:
             click.echo("Error: Either instance name or --id must be provided", err=True)
@@ -225,13 +284,14 @@ def console(name: Optional[str], id: Optional[int], verbose: bool):
             click.echo(f"Error: Failed to read status for instance '{instance_name}'", err=True)
             sys.exit(1)
 
-        if status.lower() != InstanceState.ACTIVE.value:
+        active = InstanceState.ACTIVE.value
+        if status.casefold() != active:
             click.echo(
                 f"Error: Instance '{instance_name}' is not active (status: '{status}')",
                 err=True,
             )
             click.echo(
-                f"Console attachment requires the instance to be in '{InstanceState.ACTIVE.value}' state.",
+                f"Console attachment requires the instance to be in '{active}' state.",
                 err=True,
             )
             click.echo(f"Start the instance with: kerf exec {instance_name}", err=True)
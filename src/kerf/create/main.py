@@ -20,10 +20,16 @@ Resources are validated against the baseline and existing instances before
 creating an overlay and applying it to the kernel.
 """
 
-import copy
+import dataclasses
 import sys
 import traceback
-from typing import List, Optional
+import re
+import string
+from bisect import bisect_right
+from collections import defaultdict
+from itertools import chain, compress, islice, zip_longest
+from operator import sub
+from typing import List, Optional, Tuple
 import click
 
 from ..runtime import DeviceTreeManager
@@ -35,6 +41,33 @@ from ..resources import (
     get_available_cpus,
 )
 from ..exceptions import ValidationError, KernelInterfaceError, ResourceError, ParseError
+from ..utils import get_instance_id_from_name
+
+# One CPU ID or inclusive range, e.g. "4" or "4-7"
+_CPU_RANGE_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
+# A whole comma-separated CPU specification
+_CPU_SPEC_RE = re.compile(r"\s*\d+\s*(?:-\s*\d+\s*)?(?:,\s*\d+\s*(?:-\s*\d+\s*)?)*")
+
+# Largest ID span parse_cpu_spec() will cover with a bitmap
+_CPU_MASK_SPAN_LIMIT = 1 << 20
+
+# Memory size unit suffixes and their multipliers
+_MEMORY_UNITS = {
+    "KB": 1024,
+    "MB": 1024**2,
+    "GB": 1024**3,
+    "TB": 1024**4,
+}
+
+# Raw byte count, or a (possibly fractional) number with a unit suffix
+_MEMORY_SPEC_RE = re.compile(r"(\d+)|(\d+(?:\.\d+)?)\s*(KB|MB|GB|TB)")
+
+# Characters allowed after the "0x" prefix of a memory base address
+_HEX_DIGITS = frozenset(string.hexdigits)
+
+# A comma-separated list of NUMA node IDs, where items may be empty
+_NUMA_SPEC_RE = re.compile(r"(?:\s*\d*\s*,)*\s*\d*\s*")
+_NUMA_NODE_RE = re.compile(r"\d+")
 
 
 def parse_cpu_spec(cpu_spec: str) -> List[int]:
@@ -58,8 +91,23 @@ def parse_cpu_spec(cpu_spec: str) -> List[int]:
     """
     cpu_spec = cpu_spec.strip()
 
-    # Explicit CPU specification
-    cpus = set()
+    # Fast path: a well-formed spec is validated and tokenized by two
+    # compiled regex passes instead of per-part splits
+    if _CPU_SPEC_RE.fullmatch(cpu_spec):
+        ranges = []
+        for match in _CPU_RANGE_RE.finditer(cpu_spec):
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else start
+            if start > end:
+                raise ValueError(
+                    f"Invalid CPU range format '{match.group(0).strip()}': "
+                    f"Invalid CPU range: {start} > {end}"
+                )
+            ranges.append((start, end))
+        return _cpu_ranges_to_list(ranges)
+
+    # Slow path: walk the parts individually to report what is wrong
+    ranges = []
 
     # Split by comma
     parts = [p.strip() for p in cpu_spec.split(",")]
@@ -73,47 +121,78 @@ def parse_cpu_spec(cpu_spec: str) -> List[int]:
                 end = int(end.strip())
                 if start > end:
                     raise ValueError(f"Invalid CPU range: {start} > {end}")
-                cpus.update(range(start, end + 1))
+                ranges.append((start, end))
             except ValueError as e:
                 raise ValueError(f"Invalid CPU range format '{part}': {e}") from e
         else:
             # Single CPU
             try:
-                cpus.add(int(part.strip()))
+                cpu = int(part.strip())
+                ranges.append((cpu, cpu))
             except ValueError as e:
                 raise ValueError(f"Invalid CPU ID '{part}': {e}") from e
 
-    if not cpus:
+    if not ranges:
         raise ValueError("CPU specification must include at least one CPU")
 
-    return sorted(list(cpus))
+    return _cpu_ranges_to_list(ranges)
+
+
+def _cpu_ranges_to_list(ranges: List[Tuple[int, int]]) -> List[int]:
+    """
+    Merge inclusive (start, end) CPU ranges into a sorted list of unique IDs.
+
+    Ranges are marked in a bytearray bitmap spanning the lowest to highest ID,
+    so overlapping or large ranges cost a slice assignment rather than one set
+    insertion per CPU. Very sparse specifications fall back to a set.
+    """
+    low = min(start for start, _ in ranges)
+    high = max(end for _, end in ranges)
+
+    if high - low > _CPU_MASK_SPAN_LIMIT:
+        cpus = set()
+        for start, end in ranges:
+            cpus.update(range(start, end + 1))
+        return sorted(cpus)
+
+    mask = bytearray(high - low + 1)
+    for start, end in ranges:
+        mask[start - low : end - low + 1] = b"\x01" * (end - start + 1)
+    return list(compress(range(low, high + 1), mask))
 
 
 def _find_consecutive_cpus(cpu_list: List[int], count: int) -> Optional[List[int]]:
-    """Find a consecutive range of CPUs in the list."""
-    for i in range(len(cpu_list) - count + 1):
-        is_consecutive = all(cpu_list[i + j + 1] == cpu_list[i + j] + 1 for j in range(count - 1))
-        if is_consecutive:
-            return cpu_list[i : i + count]
+    """Find a consecutive range of CPUs in the (sorted, unique) list."""
+    if count <= 0:
+        return []
+    if len(cpu_list) < count:
+        return None
+
+    # For sorted, unique IDs, cpu - index is non-decreasing and constant
+    # exactly along each run of consecutive IDs. Test one window per run
+    # and bisect to the start of the next run instead of comparing every
+    # neighbouring pair in Python.
+    offsets = list(map(sub, cpu_list, range(len(cpu_list))))
+    start = 0
+    while start + count <= len(cpu_list):
+        if offsets[start + count - 1] == offsets[start]:
+            return cpu_list[start : start + count]
+        start = bisect_right(offsets, offsets[start], start)
     return None
 
 
 def _allocate_compact(
-    tree, available: List[int], count: int, numa_nodes: Optional[List[int]]
+    tree, available: List[int], count: int, numa_nodes: Optional[List[int]], numa_buckets
 ) -> List[int]:
     """Allocate CPUs with compact affinity policy."""
     if numa_nodes and tree.hardware.topology and tree.hardware.topology.numa_nodes:
         for numa_node_id in numa_nodes:
-            numa_cpus = [
-                cpu
-                for cpu in available
-                if tree.hardware.topology.get_numa_node_for_cpu(cpu) == numa_node_id
-            ]
+            numa_cpus = numa_buckets.get(numa_node_id, [])
             if len(numa_cpus) >= count:
                 consecutive = _find_consecutive_cpus(numa_cpus, count)
                 if consecutive:
-                    return sorted(consecutive)
-                return sorted(numa_cpus[:count])
+                    return consecutive
+                return numa_cpus[:count]
 
     consecutive = _find_consecutive_cpus(available, count)
     if consecutive:
@@ -122,53 +201,36 @@ def _allocate_compact(
 
 
 def _allocate_spread(
-    tree, available: List[int], count: int, numa_nodes: Optional[List[int]]
+    tree, available: List[int], count: int, numa_nodes: Optional[List[int]], numa_buckets
 ) -> List[int]:
     """Allocate CPUs with spread affinity policy."""
     if numa_nodes and tree.hardware.topology and tree.hardware.topology.numa_nodes:
         numa_cpu_lists = {}
         for numa_node_id in numa_nodes:
-            numa_cpus = [
-                cpu
-                for cpu in available
-                if tree.hardware.topology.get_numa_node_for_cpu(cpu) == numa_node_id
-            ]
+            numa_cpus = numa_buckets.get(numa_node_id, [])
             if numa_cpus:
-                numa_cpu_lists[numa_node_id] = sorted(numa_cpus)
+                numa_cpu_lists[numa_node_id] = numa_cpus
 
         if not numa_cpu_lists:
             raise ResourceError(f"No available APIC IDs in specified NUMA nodes: {numa_nodes}")
 
-        allocated = []
-        numa_indices = {node_id: 0 for node_id in numa_cpu_lists}
-
-        for i in range(count):
-            numa_idx = i % len(numa_cpu_lists)
-            numa_node_id = list(numa_cpu_lists.keys())[numa_idx]
-            cpu_list = numa_cpu_lists[numa_node_id]
-
-            if numa_indices[numa_node_id] < len(cpu_list):
-                allocated.append(cpu_list[numa_indices[numa_node_id]])
-                numa_indices[numa_node_id] += 1
-            else:
-                for next_numa_id, next_cpu_list in numa_cpu_lists.items():
-                    if numa_indices[next_numa_id] < len(next_cpu_list):
-                        allocated.append(next_cpu_list[numa_indices[next_numa_id]])
-                        numa_indices[next_numa_id] += 1
-                        break
+        # Take CPUs round-robin across the nodes; exhausted nodes drop out
+        interleaved = chain.from_iterable(zip_longest(*numa_cpu_lists.values()))
+        allocated = list(islice((cpu for cpu in interleaved if cpu is not None), count))
 
         return sorted(allocated)
 
     if count == 1:
         return [available[0]]
 
+    # step >= 1, so the picked indices (and CPUs) are strictly increasing
     step = (len(available) - 1) / (count - 1) if count > 1 else 1
     indices = [int(i * step) for i in range(count)]
-    return sorted([available[i] for i in indices])
+    return [available[i] for i in indices]
 
 
 def _allocate_local(
-    tree, available: List[int], count: int, numa_nodes: Optional[List[int]]
+    tree, available: List[int], count: int, numa_nodes: Optional[List[int]], numa_buckets
 ) -> List[int]:
     """Allocate CPUs with local affinity policy."""
     if not tree.hardware.topology or not tree.hardware.topology.numa_nodes:
@@ -179,30 +241,30 @@ def _allocate_local(
 
     if numa_nodes and len(numa_nodes) > 0:
         numa_node_id = numa_nodes[0]
-        numa_cpus = [
-            cpu
-            for cpu in available
-            if tree.hardware.topology.get_numa_node_for_cpu(cpu) == numa_node_id
-        ]
+        numa_cpus = numa_buckets.get(numa_node_id, [])
         if len(numa_cpus) >= count:
-            return sorted(numa_cpus[:count])
+            return numa_cpus[:count]
         raise ResourceError(
             f"Not enough APIC IDs in NUMA node {numa_node_id}: "
             f"requested {count}, but only {len(numa_cpus)} available"
         )
 
     for numa_node_id in tree.hardware.topology.numa_nodes:
-        numa_cpus = [
-            cpu
-            for cpu in available
-            if tree.hardware.topology.get_numa_node_for_cpu(cpu) == numa_node_id
-        ]
+        numa_cpus = numa_buckets.get(numa_node_id, [])
         if len(numa_cpus) >= count:
-            return sorted(numa_cpus[:count])
+            return numa_cpus[:count]
 
     raise ResourceError(f"No single NUMA node has {count} available APIC IDs for 'local' affinity")
 
 
+# CPU affinity policy name -> allocator
+_AFFINITY_HANDLERS = {
+    "compact": _allocate_compact,
+    "spread": _allocate_spread,
+    "local": _allocate_local,
+}
+
+
 def allocate_cpus_from_pool(
     tree, count: int, cpu_affinity: str = "compact", numa_nodes: Optional[List[int]] = None
 ) -> List[int]:
@@ -222,16 +284,24 @@ def allocate_cpus_from_pool(
     Raises:
         ResourceError: If not enough CPUs available
     """
-    available = sorted(list(get_available_cpus(tree)))
+    available = sorted(get_available_cpus(tree))
+
+    # CPU -> NUMA node map, computed once per parsed topology
+    topology = tree.hardware.topology
+    if topology and topology.numa_nodes:
+        cpu_to_numa = topology.numa_node_of_cpu
+    else:
+        cpu_to_numa = {}
 
     # Filter by NUMA nodes if specified
-    if numa_nodes and tree.hardware.topology and tree.hardware.topology.numa_nodes:
-        numa_filtered = []
-        for cpu_id in available:
-            cpu_numa = tree.hardware.topology.get_numa_node_for_cpu(cpu_id)
-            if cpu_numa is not None and cpu_numa in numa_nodes:
-                numa_filtered.append(cpu_id)
-        available = numa_filtered
+    if numa_nodes and topology and topology.numa_nodes:
+        if not cpu_to_numa:
+            raise ResourceError(
+                f"Cannot restrict CPUs to NUMA nodes {numa_nodes}: "
+                "NUMA topology does not list the CPUs of any node"
+            )
+        numa_node_set = set(numa_nodes)
+        available = [cpu for cpu in available if cpu_to_numa.get(cpu) in numa_node_set]
 
     if len(available) < count:
         if numa_nodes:
@@ -244,13 +314,23 @@ def allocate_cpus_from_pool(
             f"but only {len(available)} available in pool"
         )
 
-    if cpu_affinity == "compact":
-        return _allocate_compact(tree, available, count, numa_nodes)
-    if cpu_affinity == "spread":
-        return _allocate_spread(tree, available, count, numa_nodes)
-    if cpu_affinity == "local":
-        return _allocate_local(tree, available, count, numa_nodes)
-    raise ValueError(f"Unknown CPU affinity policy: {cpu_affinity}")
+    # Compact and spread have no placement choice to make when taking
+    # nothing or everything ('local' must still check the NUMA layout)
+    if cpu_affinity in ("compact", "spread"):
+        if count == 0:
+            return []
+        if count == len(available):
+            return available
+
+    # Bucket the (sorted) available CPUs by NUMA node in a single pass
+    numa_buckets = defaultdict(list)
+    for cpu in available:
+        numa_buckets[cpu_to_numa.get(cpu)].append(cpu)
+
+    handler = _AFFINITY_HANDLERS.get(cpu_affinity)
+    if handler is None:
+        raise ValueError(f"Unknown CPU affinity policy: {cpu_affinity}")
+    return handler(tree, available, count, numa_nodes, numa_buckets)
 
 
 def parse_memory_spec(memory_spec: str) -> int:
@@ -274,23 +354,26 @@ def parse_memory_spec(memory_spec: str) -> int:
     """
     memory_spec = memory_spec.strip().upper()
 
-    # Check for unit suffix
-    multipliers = {
-        "KB": 1024,
-        "MB": 1024**2,
-        "GB": 1024**3,
-        "TB": 1024**4,
-    }
-
-    for unit, multiplier in multipliers.items():
-        if memory_spec.endswith(unit):
-            try:
-                value = float(memory_spec[: -len(unit)].strip())
-                return int(value * multiplier)
-            except ValueError as exc:
-                raise ValueError(
-                    f"Invalid memory value '{memory_spec}': " f"expected number before {unit}"
-                ) from exc
+    # Fast path: plain bytes or "<number><unit>", converted only once the
+    # shape is known to be valid
+    match = _MEMORY_SPEC_RE.fullmatch(memory_spec)
+    if match:
+        raw_bytes, value, unit = match.groups()
+        if raw_bytes is not None:
+            return int(raw_bytes)
+        return int(float(value) * _MEMORY_UNITS[unit])
+
+    # Every unit is two characters, so the suffix is a single table lookup
+    unit = memory_spec[-2:]
+    multiplier = _MEMORY_UNITS.get(unit)
+    if multiplier is not None:
+        try:
+            value = float(memory_spec[:-2].strip())
+            return int(value * multiplier)
+        except ValueError as exc:
+            raise ValueError(
+                f"Invalid memory value '{memory_spec}': " f"expected number before {unit}"
+            ) from exc
 
     # No unit, assume bytes
     try:
@@ -321,6 +404,14 @@ def parse_memory_base(base_spec: str) -> int:
     """
     base_spec = base_spec.strip()
 
+    # Fast paths: plain hex or decimal digits convert without a try/except
+    if base_spec[:2] in ("0x", "0X"):
+        digits = base_spec[2:]
+        if digits and _HEX_DIGITS.issuperset(digits):
+            return int(digits, 16)
+    elif base_spec.isdecimal():
+        return int(base_spec)
+
     if base_spec.startswith("0x") or base_spec.startswith("0X"):
         try:
             return int(base_spec, 16)
@@ -355,6 +446,30 @@ def parse_device_list(device_spec: Optional[str]) -> List[str]:
     return devices
 
 
+def parse_numa_nodes(numa_spec: str) -> List[int]:
+    """
+    Parse NUMA node specification string into node IDs.
+
+    Supports formats:
+    - "0" (single NUMA node)
+    - "0,1" (comma-separated NUMA nodes)
+
+    Args:
+        numa_spec: NUMA node specification string
+
+    Returns:
+        List of NUMA node IDs in the order given (empty items are skipped)
+
+    Raises:
+        ValueError: If a node ID is not an integer
+    """
+    # Fast path: digits-only lists are validated and tokenized by regex
+    if _NUMA_SPEC_RE.fullmatch(numa_spec):
+        return [int(node) for node in _NUMA_NODE_RE.findall(numa_spec)]
+
+    return [int(n.strip()) for n in numa_spec.split(",") if n.strip()]
+
+
 def dump_overlay_for_debug(
     manager: DeviceTreeManager, current, modified, instance_name: str, suffix: str = ""
 ) -> None:
@@ -411,7 +526,7 @@ def dump_overlay_for_debug(
 )
 @click.option(
     "--cpu-affinity",
-    type=click.Choice(["compact", "spread", "local"]),
+    type=click.Choice(list(_AFFINITY_HANDLERS)),
     default="compact",
     help="CPU affinity policy: compact (same NUMA node, consecutive), "
     "spread (across NUMA nodes), or local (co-locate with memory)",
@@ -574,7 +689,7 @@ def create(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         numa_node_list = None
         if numa_nodes:
             try:
-                numa_node_list = [int(n.strip()) for n in numa_nodes.split(",") if n.strip()]
+                numa_node_list = parse_numa_nodes(numa_nodes)
                 if not numa_node_list:
                     click.echo(f"Error: Invalid NUMA nodes specification '{numa_nodes}'", err=True)
                     sys.exit(2)
@@ -595,32 +710,31 @@ def create(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         # Initialize manager
         manager = DeviceTreeManager()
 
+        # Instance built by the last run of create_instance_operation
+        created_instance = None
+
         # Define operation to create instance
         def create_instance_operation(current):
             """Operation function to create instance in device tree."""
             nonlocal memory_base_addr  # Allow modification of outer scope variable
+            nonlocal created_instance
 
             if manager.has_instance(name):
                 raise ResourceError(f"Instance '{name}' already exists")
             if name in current.instances:
                 pass
 
-            # Create modified state
-            modified = copy.deepcopy(current)
+            # Create modified state. Only the instances mapping is changed, so
+            # copy that and share the (read-only) hardware inventory.
+            modified = dataclasses.replace(current, instances=dict(current.instances))
 
             # Check if instance ID is already in use (if specified)
             if instance_id is not None:
-                existing_ids = {
-                    inst.id for inst in modified.instances.values() if inst.id is not None
-                }
-                if instance_id in existing_ids:
-                    # Find which instance uses this ID
-                    for inst_name, inst in modified.instances.items():
-                        if inst.id == instance_id:
-                            raise ResourceError(
-                                f"Instance ID {instance_id} is already in use "
-                                f"by instance '{inst_name}'"
-                            )
+                owner = current.instance_names_by_id().get(instance_id)
+                if owner is not None:
+                    raise ResourceError(
+                        f"Instance ID {instance_id} is already in use by instance '{owner}'"
+                    )
                 final_instance_id = instance_id
             else:
                 final_instance_id = None
@@ -681,6 +795,7 @@ def create(  # pylint: disable=too-many-arguments,too-many-positional-arguments
 
             # Add to modified state
             modified.instances[name] = instance
+            created_instance = instance
 
             return modified
 
@@ -736,9 +851,13 @@ def create(  # pylint: disable=too-many-arguments,too-many-positional-arguments
 
             click.echo(f"✓ Created instance '{name}' (transaction {tx_id})")
             if verbose:
-                current = manager.read_baseline()
-                instance = current.instances[name]
-                click.echo(f"  Instance ID: {instance.id}")
+                # Report what the applied operation built rather than parsing
+                # the device tree again; only an auto-assigned ID is unknown.
+                instance = created_instance
+                assigned_id = instance.id
+                if assigned_id is None:
+                    assigned_id = get_instance_id_from_name(name)
+                click.echo(f"  Instance ID: {assigned_id}")
                 click.echo(f"  CPUs: {', '.join(map(str, instance.resources.cpus))}")
                 if instance.resources.cpu_affinity:
                     click.echo(f"  CPU Affinity: {instance.resources.cpu_affinity}")
@@ -30,6 +30,41 @@ from ..exceptions import ResourceError, ValidationError, KernelInterfaceError, P
 from ..utils import get_instance_id_from_name, get_instance_name_from_id, get_instance_status
 
 
+def dump_removal_overlay_for_debug(
+    manager: DeviceTreeManager, instance_name: str, verbose: bool, suffix: str = ""
+) -> Optional[bytes]:
+    """
+    Dump the removal overlay DTS source to stdout when --debug is enabled.
+
+    Returns:
+        The generated overlay blob, so it can be applied without generating
+        it again, or None if generation failed
+    """
+    dtbo_data = None
+    try:
+        from ..dtc.parser import DeviceTreeParser
+        import libfdt
+
+        dtbo_data = manager.overlay_gen.generate_removal_overlay(instance_name)
+        fdt = libfdt.Fdt(dtbo_data)
+        parser = DeviceTreeParser()
+        parser.fdt = fdt
+        dts_lines = parser._fdt_to_dts_recursive(0, 0)  # pylint: disable=protected-access
+        dts_content = "\n".join(dts_lines)
+
+        click.echo(f"\nDebug: Overlay DTS source for deletion of '{instance_name}'{suffix}:")
+        click.echo("─" * 70)
+        click.echo(dts_content)
+        click.echo("─" * 70)
+    except Exception as e:
+        click.echo(f"Debug: Failed to generate DTS output: {e}", err=True)
+        if verbose:
+            import traceback
+
+            traceback.print_exc()
+    return dtbo_data
+
+
 @click.command(name="delete")
 @click.argument("name", required=False)
 @click.option("--id", type=int, help="Multikernel instance ID to delete (alternative to name)")
@@ -60,6 +95,11 @@ def delete(
             click.echo("Usage: kerf delete <name>  or  kerf delete --id=<id>", err=True)
             sys.exit(2)
 
+        # Reject a bad --id before the manager touches the kernel interface
+        if not name and not 1 <= id <= 511:
+            click.echo(f"Error: --id must be between 1 and 511 (got {id})", err=True)
+            sys.exit(2)
+
         debug = ctx.obj.get("debug", False) if ctx and ctx.obj else False
 
         manager = DeviceTreeManager()
@@ -82,10 +122,6 @@ def delete(
                 click.echo(f"Instance name: {name} (ID: {instance_id})")
         else:
             instance_id = id
-            if instance_id < 1 or instance_id > 511:
-                click.echo(f"Error: --id must be between 1 and 511 (got {instance_id})", err=True)
-                sys.exit(2)
-
             instance_name = get_instance_name_from_id(instance_id)
             if not instance_name:
                 click.echo(f"Error: Instance with ID {instance_id} not found", err=True)
@@ -130,29 +166,7 @@ def delete(
                 click.echo(f"  Instance ID: {instance_id}")
 
                 if debug:
-                    try:
-                        from ..dtc.parser import DeviceTreeParser
-                        import libfdt
-
-                        dtbo_data = manager.overlay_gen.generate_removal_overlay(instance_name)
-                        fdt = libfdt.Fdt(dtbo_data)
-                        parser = DeviceTreeParser()
-                        parser.fdt = fdt
-                        dts_lines = parser._fdt_to_dts_recursive(0, 0)  # pylint: disable=protected-access
-                        dts_content = "\n".join(dts_lines)
-
-                        click.echo(
-                            f"\nDebug: Overlay DTS source for deletion of '{instance_name}' (dry-run):"
-                        )
-                        click.echo("─" * 70)
-                        click.echo(dts_content)
-                        click.echo("─" * 70)
-                    except Exception as e:
-                        click.echo(f"Debug: Failed to generate DTS output: {e}", err=True)
-                        if verbose:
-                            import traceback
-
-                            traceback.print_exc()
+                    dump_removal_overlay_for_debug(manager, instance_name, verbose, " (dry-run)")
 
                 click.echo("\n✓ Instance would be deleted (dry-run mode)")
                 click.echo("  Remove --dry-run to apply overlay to kernel")
@@ -165,30 +179,12 @@ def delete(
             return
 
         try:
+            # Generated once when the debug output needs it, then applied as is
+            dtbo_data = None
             if debug:
-                try:
-                    from ..dtc.parser import DeviceTreeParser
-                    import libfdt
-
-                    dtbo_data = manager.overlay_gen.generate_removal_overlay(instance_name)
-                    fdt = libfdt.Fdt(dtbo_data)
-                    parser = DeviceTreeParser()
-                    parser.fdt = fdt
-                    dts_lines = parser._fdt_to_dts_recursive(0, 0)  # pylint: disable=protected-access
-                    dts_content = "\n".join(dts_lines)
-
-                    click.echo(f"\nDebug: Overlay DTS source for deletion of '{instance_name}':")
-                    click.echo("─" * 70)
-                    click.echo(dts_content)
-                    click.echo("─" * 70)
-                except Exception as e:
-                    click.echo(f"Debug: Failed to generate DTS output: {e}", err=True)
-                    if verbose:
-                        import traceback
-
-                        traceback.print_exc()
-
-            tx_id = manager.apply_removal_overlay(instance_name)
+                dtbo_data = dump_removal_overlay_for_debug(manager, instance_name, verbose)
+
+            tx_id = manager.apply_removal_overlay(instance_name, dtbo_data)
 
             click.echo(f"✓ Deleted instance '{instance_name}' (transaction {tx_id})")
             if verbose:
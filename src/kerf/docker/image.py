@@ -163,36 +163,39 @@ def extract_image(image_ref: str, instance_name: str) -> Tuple[str, List[str]]:
         cmd = []
 
         with tarfile.open(tar_path, 'r') as tar:
+            # Read the member table once; manifest, config and layers are
+            # then found by name instead of a scan per lookup
+            members = {member.name: member for member in tar.getmembers()}
+
             manifest_data = None
-            for member in tar.getmembers():
-                if member.name == "manifest.json":
-                    f = tar.extractfile(member)
-                    if f:
-                        manifest_data = json.load(f)
-                    break
+            member = members.get("manifest.json")
+            if member:
+                f = tar.extractfile(member)
+                if f:
+                    manifest_data = json.load(f)
 
             if manifest_data and len(manifest_data) > 0:
                 config_file = manifest_data[0].get("Config", "")
-                if config_file:
-                    for member in tar.getmembers():
-                        if member.name == config_file:
-                            f = tar.extractfile(member)
-                            if f:
-                                config = json.load(f)
-                                oci_config = config.get("config", {})
-                                entrypoint = oci_config.get("Entrypoint") or []
-                                cmd = oci_config.get("Cmd") or []
-                            break
+                member = members.get(config_file) if config_file else None
+                if member:
+                    f = tar.extractfile(member)
+                    if f:
+                        config = json.load(f)
+                        oci_config = config.get("config", {})
+                        entrypoint = oci_config.get("Entrypoint") or []
+                        cmd = oci_config.get("Cmd") or []
 
                 layers = manifest_data[0].get("Layers", [])
                 for layer_name in layers:
-                    for member in tar.getmembers():
-                        if member.name == layer_name:
-                            layer_file = tar.extractfile(member)
-                            if layer_file:
-                                with tarfile.open(fileobj=layer_file, mode='r:*') as layer_tar:
-                                    layer_tar.extractall(path=rootfs_path)
-                            break
+                    member = members.get(layer_name)
+                    if member:
+                        layer_file = tar.extractfile(member)
+                        if layer_file:
+                            # Stream mode unpacks each member as it is read;
+                            # 'r:*' would read the whole (often gzipped)
+                            # layer to list it, then seek back and read it again
+                            with tarfile.open(fileobj=layer_file, mode='r|*') as layer_tar:
+                                layer_tar.extractall(path=rootfs_path)
 
     return str(rootfs_path), entrypoint + cmd
 
@@ -19,9 +19,28 @@ Internal module providing device tree compilation, validation, and instance extr
 capabilities.
 """
 
-from .parser import DeviceTreeParser
-from .validator import MultikernelValidator
-from .extractor import InstanceExtractor
-from .reporter import ValidationReporter
+import importlib
 
 __all__ = ["DeviceTreeParser", "MultikernelValidator", "InstanceExtractor", "ValidationReporter"]
+
+# Resolved on first access, so importing one submodule (e.g. dtc.overlay)
+# does not load the parser, validator, extractor and reporter as well.
+_LAZY = {
+    "DeviceTreeParser": ("kerf.dtc.parser", "DeviceTreeParser"),
+    "MultikernelValidator": ("kerf.dtc.validator", "MultikernelValidator"),
+    "InstanceExtractor": ("kerf.dtc.extractor", "InstanceExtractor"),
+    "ValidationReporter": ("kerf.dtc.reporter", "ValidationReporter"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module_name, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module_name), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -13,22 +13,44 @@
 # limitations under the License.
 
 """
-Device tree cell encoding for physical CPU IDs.
+Device tree cell encoding for physical CPU IDs and 32-bit cell arrays.
 
 The kernel's multikernel core identifies CPUs by their physical ID (APIC
 ID on x86, MPIDR on arm64, hartid on riscv), which is a sparse 64-bit
 value. All "cpus" properties and cpu@N reg cells therefore use 64-bit
 cells; 32-bit cells are still accepted on the parse side for device
 trees written before the widening.
+
+Plain 32-bit cell arrays (VF and namespace lists, NUMA node IDs) are
+encoded here as well, so every DTB writer packs cells the same way.
 """
 
 import struct
+import sys
+from array import array
 from typing import List, Sequence
 
 
+# array typecode with 4-byte items ('I' is 4 bytes on all supported ABIs)
+_U32_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+
+def pack_u32_array(values: Sequence[int]) -> bytes:
+    """Encode integers as an array of big-endian 32-bit device tree cells."""
+    # Converting through array avoids unpacking every value as an argument
+    cells = array(_U32_TYPECODE, values)
+    if sys.byteorder == "little":
+        cells.byteswap()
+    return cells.tobytes()
+
+
 def pack_cpu_ids(cpu_ids: Sequence[int]) -> bytes:
     """Encode physical CPU IDs as an array of 64-bit device tree cells."""
-    return struct.pack(">" + "Q" * len(cpu_ids), *cpu_ids)
+    # Converting through array avoids unpacking every ID as an argument
+    cells = array("Q", cpu_ids)
+    if sys.byteorder == "little":
+        cells.byteswap()
+    return cells.tobytes()
 
 
 def pack_cpu_id(cpu_id: int) -> bytes:
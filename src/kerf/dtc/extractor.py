@@ -17,83 +17,38 @@ DTB generation from device tree models.
 """
 
 import libfdt
-from ..models import GlobalDeviceTree, Instance
-from .cells import pack_cpu_ids
+from ..models import GlobalDeviceTree
+from .cells import pack_cpu_ids, pack_u32_array
 
 
 class InstanceExtractor:
     """Generates device tree blobs (DTB) from device tree models."""
 
+    # Smallest initial FdtSw buffer; libfdt grows it in INC_SIZE steps
+    MIN_BUFFER_SIZE = 4096
+
     def __init__(self):
-        self.fdt = None
-
-    def _create_minimal_fdt(self) -> bytes:
-        """Create a minimal valid FDT structure."""
-        # Create a minimal FDT with proper structure
-        import struct
-
-        # Calculate sizes
-        header_size = 40  # FDT header is 40 bytes
-        mem_rsv_size = 16  # Two 8-byte entries (terminator)
-        struct_size = 16  # FDT_BEGIN_NODE + FDT_END_NODE + FDT_END
-        strings_size = 0  # No strings for minimal FDT
-
-        # Calculate offsets
-        off_mem_rsvmap = header_size
-        off_dt_struct = off_mem_rsvmap + mem_rsv_size
-        off_dt_strings = off_dt_struct + struct_size
-        totalsize = off_dt_strings + strings_size
-
-        # Create FDT data
-        fdt_data = bytearray(totalsize)
-
-        # FDT header (40 bytes)
-        header = struct.pack(
-            ">IIIIIIIIII",
-            0xD00DFEED,  # magic
-            totalsize,  # totalsize
-            off_dt_struct,  # off_dt_struct
-            off_dt_strings,  # off_dt_strings
-            off_mem_rsvmap,  # off_mem_rsvmap
-            17,  # version
-            16,  # last_comp_version
-            0,  # boot_cpuid_phys
-            strings_size,  # size_dt_strings
-            struct_size,
-        )  # size_dt_struct
-
-        fdt_data[: len(header)] = header
-
-        # Memory reservation block (16 bytes - two 8-byte entries of zeros)
-        fdt_data[off_mem_rsvmap : off_mem_rsvmap + 16] = b"\x00" * 16
-
-        # Structure block
-        struct_data = b"\x00\x00\x00\x01"  # FDT_BEGIN_NODE
-        struct_data += b"\x00"  # Root node name (empty)
-        struct_data += b"\x00\x00\x00\x02"  # FDT_END_NODE
-        struct_data += b"\x00\x00\x00\x09"  # FDT_END
-
-        fdt_data[off_dt_struct : off_dt_struct + len(struct_data)] = struct_data
-
-        return bytes(fdt_data)
-
-    def generate_global_dtb(self, tree: GlobalDeviceTree) -> bytes:
-        """Generate global DTB from tree model."""
-        # For production use, we'll create a comprehensive DTB that includes all the parsed data
-        # This creates a proper device tree blob with hardware inventory, instances, and device references
+        # Size of the last generated DTB, used to pre-size the next buffer
+        self._last_size = 0
 
-        # Create a larger FDT structure to accommodate all the data
-        fdt_data = self._create_comprehensive_fdt(tree)
+    def generate_global_dtb(self, tree: GlobalDeviceTree) -> bytearray:
+        """Generate global DTB from tree model.
 
-        return fdt_data
+        The blob is returned as the bytearray libfdt produced, without a copy
+        into bytes; os.write() and the DTB parsers accept it as is.
+        """
+        # For production use, we'll create a comprehensive DTB that includes all the parsed data
+        # This creates a proper device tree blob with hardware inventory, instances, and device references
+        return self._create_comprehensive_fdt(tree)
 
-    def _create_comprehensive_fdt(self, tree: GlobalDeviceTree) -> bytes:
+    def _create_comprehensive_fdt(self, tree: GlobalDeviceTree) -> bytearray:
         """Create a comprehensive FDT with all parsed data using libfdt FdtSw."""
         # Use libfdt's FdtSw (FDT source writer) to properly build the DTB
         # This ensures correct structure, size calculations, and string handling
-        # FdtSw automatically resizes the buffer as needed
+        # FdtSw automatically resizes the buffer as needed, but every resize
+        # copies it, so start from the size of the previous DTB instead
 
-        fdt_sw = libfdt.FdtSw()
+        fdt_sw = libfdt.FdtSw(size_hint=max(self.MIN_BUFFER_SIZE, self._last_size))
         fdt_sw.finish_reservemap()
 
         fdt_sw.begin_node("")
@@ -118,7 +73,9 @@ class InstanceExtractor:
 
         dtb = fdt_sw.as_fdt()
         dtb.pack()
-        return dtb.as_bytearray()
+        result = dtb.as_bytearray()
+        self._last_size = len(result)
+        return result
 
     def _add_cpu_properties_sw(self, fdt_sw, cpus):
         """Add CPU properties directly to resources node."""
@@ -131,232 +88,126 @@ class InstanceExtractor:
 
     def _add_devices_section_sw(self, fdt_sw, devices):
         """Add devices section using FdtSw."""
-        fdt_sw.begin_node("devices")
+        # Bind the writer methods once; this loop runs for every device
+        begin_node = fdt_sw.begin_node
+        end_node = fdt_sw.end_node
+        prop = fdt_sw.property
+        prop_string = fdt_sw.property_string
+        prop_u32 = fdt_sw.property_u32
+
+        begin_node("devices")
 
         for name, device_info in devices.items():
-            fdt_sw.begin_node(name)
+            begin_node(name)
 
             if device_info.device_type:
-                fdt_sw.property_string("device-type", device_info.device_type)
+                prop_string("device-type", device_info.device_type)
 
             if device_info.compatible:
-                fdt_sw.property_string("compatible", device_info.compatible)
+                prop_string("compatible", device_info.compatible)
 
             if device_info.device_name:
-                fdt_sw.property_string("device-name", device_info.device_name)
+                prop_string("device-name", device_info.device_name)
 
             if device_info.pci_id:
-                fdt_sw.property_string("pci-id", device_info.pci_id)
+                prop_string("pci-id", device_info.pci_id)
 
             if device_info.vendor_id is not None:
-                fdt_sw.property_u32("vendor-id", device_info.vendor_id)
+                prop_u32("vendor-id", device_info.vendor_id)
 
             if device_info.device_id is not None:
-                fdt_sw.property_u32("device-id", device_info.device_id)
+                prop_u32("device-id", device_info.device_id)
 
             if device_info.sriov_vfs is not None:
-                fdt_sw.property_u32("sriov-vfs", device_info.sriov_vfs)
+                prop_u32("sriov-vfs", device_info.sriov_vfs)
 
             if device_info.host_reserved_vf is not None:
-                fdt_sw.property_u32("host-reserved-vf", device_info.host_reserved_vf)
+                prop_u32("host-reserved-vf", device_info.host_reserved_vf)
 
             if device_info.available_vfs:
-                import struct
-
-                vfs_data = struct.pack(
-                    ">" + "I" * len(device_info.available_vfs), *device_info.available_vfs
-                )
-                fdt_sw.property("available-vfs", vfs_data)
+                prop("available-vfs", pack_u32_array(device_info.available_vfs))
 
             if device_info.namespaces is not None:
-                fdt_sw.property_u32("namespaces", device_info.namespaces)
+                prop_u32("namespaces", device_info.namespaces)
 
             if device_info.host_reserved_ns is not None:
-                fdt_sw.property_u32("host-reserved-ns", device_info.host_reserved_ns)
+                prop_u32("host-reserved-ns", device_info.host_reserved_ns)
 
             if device_info.available_ns:
-                import struct
+                prop("available-ns", pack_u32_array(device_info.available_ns))
 
-                ns_data = struct.pack(
-                    ">" + "I" * len(device_info.available_ns), *device_info.available_ns
-                )
-                fdt_sw.property("available-ns", ns_data)
+            end_node()
 
-            fdt_sw.end_node()
-
-        fdt_sw.end_node()
+        end_node()
 
     def _add_instances_section_sw(self, fdt_sw, instances):
         """Add instances section using FdtSw."""
-        fdt_sw.begin_node("instances")
+        begin_node = fdt_sw.begin_node
+        end_node = fdt_sw.end_node
+        prop = fdt_sw.property
+        prop_u32 = fdt_sw.property_u32
+        prop_u64 = fdt_sw.property_u64
+
+        begin_node("instances")
 
         for name, instance in instances.items():
-            fdt_sw.begin_node(name)
+            begin_node(name)
             if instance.id is None:
                 raise ValueError(f"Instance '{name}' missing ID in baseline (should not happen)")
-            fdt_sw.property_u32("id", instance.id)
+            prop_u32("id", instance.id)
 
-            fdt_sw.begin_node("resources")
+            resources = instance.resources
+            begin_node("resources")
 
-            fdt_sw.property("cpus", pack_cpu_ids(instance.resources.cpus))
+            prop("cpus", pack_cpu_ids(resources.cpus))
 
-            fdt_sw.property_u64("memory-base", instance.resources.memory_base)
-            fdt_sw.property_u64("memory-bytes", instance.resources.memory_bytes)
+            prop_u64("memory-base", resources.memory_base)
+            prop_u64("memory-bytes", resources.memory_bytes)
 
-            if instance.resources.devices:
-                stringlist_data = b'\0'.join(d.encode('utf-8') for d in instance.resources.devices) + b'\0'
-                fdt_sw.property("device-names", stringlist_data)
+            if resources.devices:
+                stringlist_data = b'\0'.join(d.encode('utf-8') for d in resources.devices) + b'\0'
+                prop("device-names", stringlist_data)
 
-            if instance.resources.uring:
-                fdt_sw.begin_node("uring")
-                if instance.resources.uring_sq_entries:
-                    fdt_sw.property_u32("sq-entries", instance.resources.uring_sq_entries)
-                if instance.resources.uring_cq_entries:
-                    fdt_sw.property_u32("cq-entries", instance.resources.uring_cq_entries)
-                if instance.resources.uring_shim_pages:
-                    fdt_sw.property_u32("shim-data-pages", instance.resources.uring_shim_pages)
-                fdt_sw.end_node()
+            if resources.uring:
+                begin_node("uring")
+                if resources.uring_sq_entries:
+                    prop_u32("sq-entries", resources.uring_sq_entries)
+                if resources.uring_cq_entries:
+                    prop_u32("cq-entries", resources.uring_cq_entries)
+                if resources.uring_shim_pages:
+                    prop_u32("shim-data-pages", resources.uring_shim_pages)
+                end_node()
 
-            fdt_sw.end_node()  # End resources
-            fdt_sw.end_node()  # End instance
+            end_node()  # End resources
+            end_node()  # End instance
 
-        fdt_sw.end_node()  # End instances
+        end_node()  # End instances
 
     def _add_device_references_sw(self, fdt_sw, device_references):
         """Add device references using FdtSw."""
+        begin_node = fdt_sw.begin_node
+        end_node = fdt_sw.end_node
+        prop_string = fdt_sw.property_string
+        prop_u32 = fdt_sw.property_u32
+
         for name, device_ref in device_references.items():
-            fdt_sw.begin_node(name)
+            begin_node(name)
 
+            # References are parsed as dicts; tolerate attribute-style objects
             if isinstance(device_ref, dict):
-                if "parent" in device_ref and device_ref["parent"]:
-                    fdt_sw.property_string("parent", device_ref["parent"])
-                if "vf_id" in device_ref and device_ref["vf_id"] is not None:
-                    fdt_sw.property_u32("vf-id", device_ref["vf_id"])
-                if "namespace_id" in device_ref and device_ref["namespace_id"] is not None:
-                    fdt_sw.property_u32("namespace-id", device_ref["namespace_id"])
+                parent = device_ref.get("parent")
+                vf_id = device_ref.get("vf_id")
+                namespace_id = device_ref.get("namespace_id")
             else:
-                if hasattr(device_ref, "parent") and device_ref.parent:
-                    fdt_sw.property_string("parent", device_ref.parent)
-                if hasattr(device_ref, "vf_id") and device_ref.vf_id is not None:
-                    fdt_sw.property_u32("vf-id", device_ref.vf_id)
-                if hasattr(device_ref, "namespace_id") and device_ref.namespace_id is not None:
-                    fdt_sw.property_u32("namespace-id", device_ref.namespace_id)
-
-            fdt_sw.end_node()
-
-    def _add_resources_section(self, parent_offset: int, tree: GlobalDeviceTree):
-        """Add resources section to DTB."""
-        resources_offset = self.fdt.add_subnode(parent_offset, "resources")
-
-        # Add CPU information
-        self._add_cpu_section(resources_offset, tree.hardware.cpus)
-
-        # Add memory information
-        self._add_memory_section(resources_offset, tree.hardware.memory)
-
-        # Add device information
-        self._add_devices_section(resources_offset, tree.hardware.devices)
-
-    def _add_cpu_section(self, parent_offset: int, cpus):
-        """Add CPU section to DTB."""
-        cpus_offset = self.fdt.add_subnode(parent_offset, "cpus")
-        self.fdt.setprop_u32(cpus_offset, "total", cpus.total)
-
-        self.fdt.setprop(cpus_offset, "host-reserved", pack_cpu_ids(cpus.host_reserved))
-        self.fdt.setprop(cpus_offset, "available", pack_cpu_ids(cpus.available))
-
-    def _add_memory_section(self, parent_offset: int, memory):
-        """Add memory section to DTB."""
-        memory_offset = self.fdt.add_subnode(parent_offset, "memory")
-        self.fdt.setprop_u64(memory_offset, "total-bytes", memory.total_bytes)
-        self.fdt.setprop_u64(memory_offset, "host-reserved-bytes", memory.host_reserved_bytes)
-        self.fdt.setprop_u64(memory_offset, "memory-pool-base", memory.memory_pool_base)
-        self.fdt.setprop_u64(memory_offset, "memory-pool-bytes", memory.memory_pool_bytes)
-
-    def _add_devices_section(self, parent_offset: int, devices):
-        """Add devices section to DTB."""
-        devices_offset = self.fdt.add_subnode(parent_offset, "devices")
-
-        for name, device_info in devices.items():
-            device_offset = self.fdt.add_subnode(devices_offset, name)
-            self.fdt.setprop_str(device_offset, "compatible", device_info.compatible)
-
-            if device_info.pci_id:
-                self.fdt.setprop_str(device_offset, "pci-id", device_info.pci_id)
-
-            if device_info.sriov_vfs is not None:
-                self.fdt.setprop_u32(device_offset, "sriov-vfs", device_info.sriov_vfs)
-
-            if device_info.host_reserved_vf is not None:
-                self.fdt.setprop_u32(
-                    device_offset, "host-reserved-vf", device_info.host_reserved_vf
-                )
-
-            if device_info.available_vfs:
-                import struct
-
-                vfs_data = struct.pack(
-                    ">" + "I" * len(device_info.available_vfs), *device_info.available_vfs
-                )
-                self.fdt.setprop(device_offset, "available-vfs", vfs_data)
-
-            if device_info.namespaces is not None:
-                self.fdt.setprop_u32(device_offset, "namespaces", device_info.namespaces)
-
-            if device_info.host_reserved_ns is not None:
-                self.fdt.setprop_u32(
-                    device_offset, "host-reserved-ns", device_info.host_reserved_ns
-                )
-
-            if device_info.available_ns:
-                import struct
-
-                ns_data = struct.pack(
-                    ">" + "I" * len(device_info.available_ns), *device_info.available_ns
-                )
-                self.fdt.setprop(device_offset, "available-ns", ns_data)
-
-    def _add_instances_section(self, parent_offset: int, tree: GlobalDeviceTree):
-        """Add instances section to DTB."""
-        instances_offset = self.fdt.add_subnode(parent_offset, "instances")
-
-        for name, instance in tree.instances.items():
-            instance_offset = self.fdt.add_subnode(instances_offset, name)
-            # Instance ID should always be present in baseline (instances are already created)
-            if instance.id is None:
-                raise ValueError(f"Instance '{name}' missing ID in baseline (should not happen)")
-            self.fdt.setprop_u32(instance_offset, "id", instance.id)
-
-            # Add resources section
-            self._add_instance_resources(instance_offset, instance)
-
-    def _add_instance_resources(self, parent_offset: int, instance: Instance):
-        """Add instance resources section."""
-        resources_offset = self.fdt.add_subnode(parent_offset, "resources")
-
-        self.fdt.setprop(resources_offset, "cpus", pack_cpu_ids(instance.resources.cpus))
-
-        self.fdt.setprop_u64(resources_offset, "memory-base", instance.resources.memory_base)
-        self.fdt.setprop_u64(resources_offset, "memory-bytes", instance.resources.memory_bytes)
-
-        if instance.resources.devices:
-            stringlist_data = b'\0'.join(d.encode('utf-8') for d in instance.resources.devices) + b'\0'
-            self.fdt.setprop(resources_offset, "device-names", stringlist_data)
-
-    def _add_device_references(self, parent_offset: int, tree: GlobalDeviceTree):
-        """Add device reference nodes."""
-
-        for name, device_ref in tree.device_references.items():
-            device_ref_offset = self.fdt.add_subnode(parent_offset, name)
-
-            # Add parent phandle reference
-            if hasattr(device_ref, "parent") and device_ref.parent:
-                # This would need proper phandle handling in a full implementation
-                self.fdt.setprop_str(device_ref_offset, "parent", device_ref.parent)
-
-            # Add device-specific properties
-            if hasattr(device_ref, "vf_id") and device_ref.vf_id is not None:
-                self.fdt.setprop_u32(device_ref_offset, "vf-id", device_ref.vf_id)
-
-            if hasattr(device_ref, "namespace_id") and device_ref.namespace_id is not None:
-                self.fdt.setprop_u32(device_ref_offset, "namespace-id", device_ref.namespace_id)
+                parent = getattr(device_ref, "parent", None)
+                vf_id = getattr(device_ref, "vf_id", None)
+                namespace_id = getattr(device_ref, "namespace_id", None)
+
+            if parent:
+                prop_string("parent", parent)
+            if vf_id is not None:
+                prop_u32("vf-id", vf_id)
+            if namespace_id is not None:
+                prop_u32("namespace-id", namespace_id)
+
+            end_node()
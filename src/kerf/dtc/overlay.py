@@ -19,12 +19,16 @@ This module provides the OverlayGenerator class for generating device tree
 overlays (DTBO) that represent incremental changes to the device tree state.
 """
 
+import struct
 from typing import Set
 
 import libfdt
 
 from ..models import GlobalDeviceTree
-from .cells import pack_cpu_id, pack_cpu_ids
+from .cells import pack_cpu_id, pack_cpu_ids, pack_u32_array
+
+# Memory region 'reg' value: 64-bit base followed by 64-bit size
+_REG_STRUCT = struct.Struct(">QQ")
 
 
 class OverlayGenerator:
@@ -92,8 +96,6 @@ class OverlayGenerator:
         Returns:
             DTBO blob as bytes containing resource update operations
         """
-        import struct
-
         fdt_sw = libfdt.FdtSw()
         fdt_sw.finish_reservemap()
 
@@ -130,7 +132,7 @@ class OverlayGenerator:
                     fdt_sw.begin_node("memory-remove")
                     fdt_sw.property_string("mk,instance", instance_name)
                     fdt_sw.begin_node("region@0")
-                    reg_data = struct.pack(">QQ", remove_base, remove_size)
+                    reg_data = _REG_STRUCT.pack(remove_base, remove_size)
                     fdt_sw.property("reg", reg_data)
                     fdt_sw.end_node()
                     fdt_sw.end_node()
@@ -139,7 +141,7 @@ class OverlayGenerator:
                 fdt_sw.begin_node("memory-remove")
                 fdt_sw.property_string("mk,instance", instance_name)
                 fdt_sw.begin_node("region@0")
-                reg_data = struct.pack(">QQ", old_mem_base, old_mem_size)
+                reg_data = _REG_STRUCT.pack(old_mem_base, old_mem_size)
                 fdt_sw.property("reg", reg_data)
                 fdt_sw.end_node()
                 fdt_sw.end_node()
@@ -154,7 +156,7 @@ class OverlayGenerator:
                     fdt_sw.begin_node("memory-add")
                     fdt_sw.property_string("mk,instance", instance_name)
                     fdt_sw.begin_node("region@0")
-                    reg_data = struct.pack(">QQ", add_base, add_size)
+                    reg_data = _REG_STRUCT.pack(add_base, add_size)
                     fdt_sw.property("reg", reg_data)
                     fdt_sw.end_node()
                     fdt_sw.end_node()
@@ -163,7 +165,7 @@ class OverlayGenerator:
                 fdt_sw.begin_node("memory-add")
                 fdt_sw.property_string("mk,instance", instance_name)
                 fdt_sw.begin_node("region@0")
-                reg_data = struct.pack(">QQ", new_mem_base, new_mem_size)
+                reg_data = _REG_STRUCT.pack(new_mem_base, new_mem_size)
                 fdt_sw.property("reg", reg_data)
                 fdt_sw.end_node()
                 fdt_sw.end_node()
@@ -231,15 +233,13 @@ class OverlayGenerator:
 
     def _add_memory_operation(self, fdt_sw, fragment_id, operation, instance_name, base, size):
         """Helper to add memory operation fragment."""
-        import struct
-
         fdt_sw.begin_node(f"fragment@{fragment_id}")
         fdt_sw.begin_node("__overlay__")
         fdt_sw.begin_node(operation)
         fdt_sw.property_string("mk,instance", instance_name)
 
         fdt_sw.begin_node("region@0")
-        reg_data = struct.pack(">QQ", base, size)
+        reg_data = _REG_STRUCT.pack(base, size)
         fdt_sw.property("reg", reg_data)
         fdt_sw.end_node()
 
@@ -319,12 +319,7 @@ class OverlayGenerator:
                 fdt_sw.property("device-names", stringlist_data)
 
             if instance.resources.numa_nodes:
-                import struct
-
-                numa_data = struct.pack(
-                    ">" + "I" * len(instance.resources.numa_nodes), *instance.resources.numa_nodes
-                )
-                fdt_sw.property("numa-nodes", numa_data)
+                fdt_sw.property("numa-nodes", pack_u32_array(instance.resources.numa_nodes))
 
             if instance.resources.cpu_affinity:
                 fdt_sw.property_string("cpu-affinity", instance.resources.cpu_affinity)
@@ -17,6 +17,7 @@ Device tree parsing and model building.
 """
 
 import re
+import struct
 from typing import Dict, List, Optional
 
 import libfdt
@@ -1423,14 +1424,21 @@ class DeviceTreeParser:
         except Exception as e:
             raise ParseError(f"Failed to convert DTB to DTS: {e}") from e
 
-    def _fdt_to_dts_recursive(self, node_offset: int, indent_level: int) -> List[str]:
-        """Recursively convert FDT nodes to DTS format."""
-        lines = []
+    def _fdt_to_dts_recursive(self, node_offset: int, indent_level: int,
+                              lines: Optional[List[str]] = None) -> List[str]:
+        """Recursively convert FDT nodes to DTS format.
+
+        Lines are appended to ``lines`` (a new list if not given), so the
+        whole tree is rendered into one list rather than one per node.
+        """
+        if lines is None:
+            lines = []
         indent = '    ' * indent_level
+        fdt = self.fdt
 
         try:
             # Get node name
-            node_name = self.fdt.get_name(node_offset)
+            node_name = fdt.get_name(node_offset)
             if not node_name:
                 node_name = '/'  # Empty name means root
 
@@ -1445,10 +1453,10 @@ class DeviceTreeParser:
 
             # Get properties for this node
             try:
-                prop_offset = self.fdt.first_property_offset(node_offset, libfdt.QUIET_NOTFOUND)
+                prop_offset = fdt.first_property_offset(node_offset, libfdt.QUIET_NOTFOUND)
                 while prop_offset >= 0:
                     try:
-                        prop = self.fdt.get_property_by_offset(prop_offset)
+                        prop = fdt.get_property_by_offset(prop_offset)
                         prop_name = prop.name
                         prop_data = bytes(prop)
 
@@ -1461,30 +1469,31 @@ class DeviceTreeParser:
                         lines.append(f'{indent}    // Error reading property: {e}')
 
                     try:
-                        prop_offset = self.fdt.next_property_offset(prop_offset, libfdt.QUIET_NOTFOUND)
+                        prop_offset = fdt.next_property_offset(prop_offset, libfdt.QUIET_NOTFOUND)
                     except Exception:
                         break
             except Exception:
                 # No properties or error accessing properties
                 pass
 
-            # Process child nodes
+            # Process child nodes. QUIET_NOTFOUND ends the walk with a
+            # negative offset instead of raising at every leaf.
             try:
-                child_offset = self.fdt.first_subnode(node_offset)
+                child_offset = fdt.first_subnode(node_offset, libfdt.QUIET_NOTFOUND)
                 while child_offset >= 0:
+                    mark = len(lines)
                     try:
-                        child_lines = self._fdt_to_dts_recursive(child_offset, indent_level + 1)
-                        lines.extend(child_lines)
+                        self._fdt_to_dts_recursive(child_offset, indent_level + 1, lines)
                     except Exception:
                         # Skip problematic child nodes
-                        pass
+                        del lines[mark:]
 
                     try:
-                        child_offset = self.fdt.next_subnode(child_offset)
+                        child_offset = fdt.next_subnode(child_offset, libfdt.QUIET_NOTFOUND)
                     except Exception:
                         break
             except Exception:
-                # No child nodes or error accessing child nodes
+                # Error accessing child nodes
                 pass
 
             # Close node
@@ -1540,7 +1549,7 @@ class DeviceTreeParser:
 
         # Handle arrays of 32-bit integers
         if len(data) % 4 == 0:
-            values = [hex(int.from_bytes(data[i:i+4], byteorder='big')) for i in range(0, len(data), 4)]
+            values = map(hex, struct.unpack(f'>{len(data) // 4}I', data))
             return f'{indent}{name} = <{" ".join(values)}>;'
 
         # Fall back to hex representation
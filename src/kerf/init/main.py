@@ -533,11 +533,12 @@ def build_baseline_from_cmdline(
 @click.option('--memory', '-m', help='Memory pool size to allocate at runtime via /dev/lazy_cma (e.g., "1GB", "512MB"). If omitted, an existing pool is discovered from /proc/iomem. Mutually exclusive with --input.')
 @click.option('--devices', '-d', help='Device names (comma-separated, e.g., "enp9s0_dev,nvme0"). Mutually exclusive with --input. Creates minimal device entries in baseline.')
 @click.option('--dry-run', is_flag=True, help='Validate without applying')
+@click.option('--verify/--no-verify', default=True, help='Run full resource validation before applying (default: on). The structural baseline check always runs.')
 @click.option('--report', is_flag=True, help='Generate detailed validation report')
 @click.option('--format', type=click.Choice(['text', 'json', 'yaml']),
               default='text', help='Report format (default: text)')
 @click.option('--verbose', '-v', is_flag=True, help='Verbose output')
-def init(ctx: click.Context, input: Optional[str], cpus: Optional[str], memory: Optional[str], devices: Optional[str], dry_run: bool, report: bool, format: str, verbose: bool):
+def init(ctx: click.Context, input: Optional[str], cpus: Optional[str], memory: Optional[str], devices: Optional[str], dry_run: bool, verify: bool, report: bool, format: str, verbose: bool):
     """
     Initialize baseline device tree configuration.
 
@@ -570,6 +571,9 @@ def init(ctx: click.Context, input: Optional[str], cpus: Optional[str], memory:
 
         # Validate baseline without applying
         kerf init --input=hardware.dts --dry-run
+
+        # Skip full validation when the input was already checked elsewhere
+        kerf init --input=hardware.dts --no-verify
     """
     try:
         # Validate that --input and resource specification options are mutually exclusive
@@ -639,37 +643,38 @@ def init(ctx: click.Context, input: Optional[str], cpus: Optional[str], memory:
             click.echo("\nInstances should be created via 'kerf create'", err=True)
             sys.exit(1)
 
-        validator = MultikernelValidator()
-        if dts_content is not None:
-            input_path_str = str(input) if input else "command-line"
-            validator.set_dts_context(dts_content, input_path_str)
+        if verify or report:
+            validator = MultikernelValidator()
+            if dts_content is not None:
+                input_path_str = str(input) if input else "command-line"
+                validator.set_dts_context(dts_content, input_path_str)
+
+            validation_result = validator.validate(tree)
 
-        validation_result = validator.validate(tree)
+            if report:
+                reporter = ValidationReporter()
+                report_text = reporter.generate_report(validation_result, tree, verbose, format)
+                click.echo(report_text)
+                if not validation_result.is_valid:
+                    sys.exit(1)
+                return
 
-        if report:
-            reporter = ValidationReporter()
-            report_text = reporter.generate_report(validation_result, tree, verbose, format)
-            click.echo(report_text)
             if not validation_result.is_valid:
+                click.echo("Validation failed:", err=True)
+                for error in validation_result.errors:
+                    click.echo(f"  ✗ {error}", err=True)
+                if validation_result.warnings:
+                    click.echo("\nWarnings:", err=True)
+                    for warning in validation_result.warnings:
+                        click.echo(f"  ⚠ {warning}", err=True)
                 sys.exit(1)
-            return
-
-        if not validation_result.is_valid:
-            click.echo("Validation failed:", err=True)
-            for error in validation_result.errors:
-                click.echo(f"  ✗ {error}", err=True)
-            if validation_result.warnings:
-                click.echo("\nWarnings:", err=True)
-                for warning in validation_result.warnings:
-                    click.echo(f"  ⚠ {warning}", err=True)
-            sys.exit(1)
 
-        if verbose:
-            click.echo("✓ Baseline validation passed")
-            if validation_result.warnings:
-                click.echo("\nWarnings:")
-                for warning in validation_result.warnings:
-                    click.echo(f"  ⚠ {warning}")
+            if verbose:
+                click.echo("✓ Baseline validation passed")
+                if validation_result.warnings:
+                    click.echo("\nWarnings:")
+                    for warning in validation_result.warnings:
+                        click.echo(f"  ⚠ {warning}")
 
         debug = ctx.obj.get('debug', False) if ctx and ctx.obj else False
 
@@ -698,7 +703,8 @@ def init(ctx: click.Context, input: Optional[str], cpus: Optional[str], memory:
 
                 if verbose:
                     click.echo("Writing baseline to kernel...")
-                baseline_mgr.write_baseline(tree)
+                # Full validation already ran above (or was disabled by --no-verify)
+                baseline_mgr.write_baseline(tree, skip_full_validation=True)
                 click.echo("✓ Baseline applied to kernel successfully")
                 click.echo("  Baseline: /sys/fs/multikernel/device_tree")
             except KernelInterfaceError as e:
@@ -17,6 +17,7 @@ Data models for multikernel device tree representation.
 """
 
 from dataclasses import dataclass
+from functools import cached_property
 from typing import List, Dict, Optional, Set, Tuple
 from enum import Enum
 
@@ -175,14 +176,21 @@ class TopologySection:
             return []
         return self.numa_nodes[numa_node].cpus
 
+    @cached_property
+    def numa_node_of_cpu(self) -> Dict[int, int]:
+        """CPU ID -> NUMA node ID, built on first use (topology is read-only once parsed)."""
+        mapping = {}
+        for node_id, node in (self.numa_nodes or {}).items():
+            for cpu_id in node.cpus:
+                # First node listing a CPU wins, as with a linear scan
+                mapping.setdefault(cpu_id, node_id)
+        return mapping
+
     def get_numa_node_for_cpu(self, cpu_id: int) -> Optional[int]:
         """Get NUMA node ID for a specific CPU."""
         if not self.numa_nodes:
             return None
-        for node_id, node in self.numa_nodes.items():
-            if cpu_id in node.cpus:
-                return node_id
-        return None
+        return self.numa_node_of_cpu.get(cpu_id)
 
     def get_memory_region_for_numa_node(self, numa_node: int) -> Optional[Tuple[int, int]]:
         """Get memory region (base, size) for a specific NUMA node."""
@@ -218,6 +226,15 @@ class GlobalDeviceTree:
     instances: Dict[str, Instance]
     device_references: Dict[str, Dict]  # phandle references
 
+    def instance_names_by_id(self) -> Dict[int, str]:
+        """Build an instance ID -> instance name map of the current instances."""
+        mapping = {}
+        for name, instance in self.instances.items():
+            if instance.id is not None:
+                # First instance with an ID wins, as with a linear scan
+                mapping.setdefault(instance.id, name)
+        return mapping
+
 
 @dataclass
 class ValidationResult:
@@ -20,10 +20,15 @@ These utilities assist with allocating CPUs, memory, and devices when
 creating or updating kernel instances.
 """
 
+import re
+from pathlib import Path
 from typing import List, Set, Optional
 from .models import GlobalDeviceTree
 from .exceptions import ResourceError
 
+# Address range at the start of a /proc/iomem line, e.g. "40000000-463fffff"
+_IOMEM_RANGE_RE = re.compile(r"([0-9a-fA-F]+)-([0-9a-fA-F]+)")
+
 
 def get_available_cpus(tree: GlobalDeviceTree) -> Set[int]:
     """
@@ -74,9 +79,6 @@ def get_allocated_memory_regions_from_iomem() -> List[tuple[int, int]]:
     """
     regions = []
     try:
-        from pathlib import Path
-        import re
-
         iomem_path = Path("/proc/iomem")
         if not iomem_path.exists():
             return regions
@@ -84,7 +86,7 @@ def get_allocated_memory_regions_from_iomem() -> List[tuple[int, int]]:
         with open(iomem_path, "r", encoding="utf-8") as f:
             for line in f:
                 if "mk-instance-" in line:
-                    match = re.search(r"([0-9a-fA-F]+)-([0-9a-fA-F]+)", line)
+                    match = _IOMEM_RANGE_RE.search(line)
                     if match:
                         base = int(match.group(1), 16)
                         end = int(match.group(2), 16)
@@ -136,6 +138,13 @@ def find_available_memory_base(
     pool_base = tree.hardware.memory.memory_pool_base
     pool_end = tree.hardware.memory.memory_pool_end
 
+    # Lowest aligned address not covered by any allocation seen so far
+    candidate = _align_up(pool_base, alignment)
+
+    # A request larger than the whole pool cannot fit anywhere
+    if candidate + size_bytes > pool_end:
+        return None
+
     if use_iomem:
         allocated_regions = get_allocated_memory_regions_from_iomem()
     else:
@@ -143,38 +152,22 @@ def find_available_memory_base(
     # Sort by base address
     allocated_regions.sort()
 
-    # Try to find gap between allocations or at start/end
-    if not allocated_regions:
-        # No allocations yet, use start of pool (aligned)
-        aligned_base = (pool_base + alignment - 1) // alignment * alignment
-        if aligned_base + size_bytes <= pool_end:
-            return aligned_base
-        return None
-
-    # Check gap at start
-    first_base = allocated_regions[0][0]
-    aligned_base = (pool_base + alignment - 1) // alignment * alignment
-    if aligned_base + size_bytes <= first_base:
-        return aligned_base
-
-    # Check gaps between allocations
-    for i in range(len(allocated_regions) - 1):
-        current_end = allocated_regions[i][0] + allocated_regions[i][1]
-        next_base = allocated_regions[i + 1][0]
-
-        # Align current_end
-        aligned_base = (current_end + alignment - 1) // alignment * alignment
+    # First fit: walk allocations in address order and stop at the first gap
+    # that holds the request, or as soon as the candidate leaves the pool
+    for base, size in allocated_regions:
+        if candidate + size_bytes <= base:
+            return candidate
+        candidate = max(candidate, _align_up(base + size, alignment))
+        if candidate + size_bytes > pool_end:
+            return None
 
-        if aligned_base + size_bytes <= next_base:
-            return aligned_base
+    # Gap at end
+    return candidate
 
-    # Check gap at end
-    last_end = allocated_regions[-1][0] + allocated_regions[-1][1]
-    aligned_base = (last_end + alignment - 1) // alignment * alignment
-    if aligned_base + size_bytes <= pool_end:
-        return aligned_base
 
-    return None
+def _align_up(addr: int, alignment: int) -> int:
+    """Round addr up to a multiple of alignment."""
+    return (addr + alignment - 1) // alignment * alignment
 
 
 def validate_cpu_allocation(
@@ -58,9 +58,9 @@ def create(name: str, cpus: List[int], memory: int):
     manager = DeviceTreeManager()
 
     def create_instance(current: GlobalDeviceTree) -> GlobalDeviceTree:
-        # Create modified state
-        import copy
-        modified = copy.deepcopy(current)
+        # Create modified state; only the instances mapping changes
+        import dataclasses
+        modified = dataclasses.replace(current, instances=dict(current.instances))
 
         # Check existence
         if name in modified.instances:
@@ -99,6 +99,7 @@ All operations follow this same pattern, ensuring consistency and validation.
 
 import os
 import re
+import time
 from pathlib import Path
 from typing import Callable, Optional, List, Dict
 from contextlib import contextmanager
@@ -221,6 +222,8 @@ class DeviceTreeManager:
 
             with open(self.overlays_new, "wb") as f:
                 f.write(dtbo_data)
+            # The kernel merges the overlay into the root device tree
+            self.baseline_mgr.clear_cache()
 
             tx_id = self._find_latest_transaction()
             if not tx_id:
@@ -260,7 +263,7 @@ class DeviceTreeManager:
                 f"Failed to write overlay to {self.overlays_new}: {e}"
             ) from e
 
-    def apply_removal_overlay(self, instance_name: str) -> str:
+    def apply_removal_overlay(self, instance_name: str, dtbo_data: Optional[bytes] = None) -> str:
         """
         Apply an instance-remove overlay directly to the kernel.
 
@@ -271,6 +274,8 @@ class DeviceTreeManager:
 
         Args:
             instance_name: Name of the instance to remove
+            dtbo_data: Removal overlay already generated for instance_name,
+                      generated here if not given
 
         Returns:
             Transaction ID from applied overlay
@@ -280,7 +285,8 @@ class DeviceTreeManager:
         """
         with self._acquire_lock():
             try:
-                dtbo_data = self.overlay_gen.generate_removal_overlay(instance_name)
+                if dtbo_data is None:
+                    dtbo_data = self.overlay_gen.generate_removal_overlay(instance_name)
             except Exception as e:
                 raise KernelInterfaceError(f"Failed to generate removal overlay: {e}") from e
 
@@ -290,6 +296,8 @@ class DeviceTreeManager:
 
                 with open(self.overlays_new, "wb") as f:
                     f.write(dtbo_data)
+                # The kernel merges the overlay into the root device tree
+                self.baseline_mgr.clear_cache()
 
                 tx_id = self._find_latest_transaction()
                 if not tx_id:
@@ -439,12 +447,8 @@ class DeviceTreeManager:
                         self.lock_file.touch(exist_ok=False)
                         lock_acquired = True
                         break
-                    import time
-
                     time.sleep(retry_delay)
                 except FileExistsError:
-                    import time
-
                     time.sleep(retry_delay)
                     continue
 
@@ -523,5 +527,5 @@ class DeviceTreeManager:
         Returns:
             True if instance exists in kernel, False otherwise
         """
-        instance_dir = Path(f"/sys/fs/multikernel/instances/{name}")
-        return instance_dir.exists() and instance_dir.is_dir()
+        # is_dir() is False for a missing path, so one stat() answers both
+        return Path(f"/sys/fs/multikernel/instances/{name}").is_dir()
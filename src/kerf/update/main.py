@@ -24,8 +24,8 @@ clean resource migration:
   4. cpu-add       - Then add CPU to instance
 """
 
+import dataclasses
 import sys
-import copy
 from typing import Optional, List
 import click
 
@@ -268,8 +268,11 @@ def update(
             except Exception as e:
                 raise ResourceError(f"Failed to read instance '{name}' device_tree: {e}") from e
 
-            modified = copy.deepcopy(current)
-            modified.instances[instance_node_name] = copy.deepcopy(existing_instance)
+            # modified is only read by the validators below, so share the
+            # hardware inventory and replace just this instance's entry
+            modified = dataclasses.replace(
+                current, instances={**current.instances, instance_node_name: existing_instance}
+            )
 
             if cpu_list is not None:
                 current_cpus = set(existing_instance.resources.cpus)
@@ -315,7 +318,10 @@ def update(
                         modified, memory_base_addr, memory_bytes, exclude_instance=instance_node_name
                     )
 
-            updated_instance = copy.deepcopy(existing_instance)
+            # Only resource fields are reassigned, never mutated in place
+            updated_instance = dataclasses.replace(
+                existing_instance, resources=dataclasses.replace(existing_instance.resources)
+            )
             if cpu_list is not None:
                 updated_instance.resources.cpus = cpu_list
             if memory_bytes is not None:
@@ -376,6 +382,8 @@ def update(
 
                     with open(manager.overlays_new, 'wb') as f:
                         f.write(dtbo_data)
+                    # The kernel merges the overlay into the root device tree
+                    manager.baseline_mgr.clear_cache()
 
                     tx_id = manager._find_latest_transaction()  # pylint: disable=protected-access
                     if not tx_id:
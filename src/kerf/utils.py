@@ -33,11 +33,9 @@ def get_instance_id_from_name(name: str) -> Optional[int]:
     Returns:
         Instance ID if found, None otherwise
     """
-    id_path = Path(f"/sys/fs/multikernel/instances/{name}/id")
-
-    if not id_path.exists():
-        return None
+    id_path = f"/sys/fs/multikernel/instances/{name}/id"
 
+    # A missing instance surfaces as FileNotFoundError from open()
     try:
         with open(id_path, "r", encoding="utf-8") as f:
             instance_id = int(f.read().strip())
@@ -83,11 +81,9 @@ def get_instance_status(name: str) -> Optional[str]:
     Returns:
         Status string if found, None otherwise
     """
-    status_path = Path(f"/sys/fs/multikernel/instances/{name}/status")
-
-    if not status_path.exists():
-        return None
+    status_path = f"/sys/fs/multikernel/instances/{name}/status"
 
+    # A missing instance surfaces as FileNotFoundError from open()
     try:
         with open(status_path, "r", encoding="utf-8") as f:
             return f.read().strip()
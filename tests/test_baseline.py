@@ -132,3 +132,25 @@ class TestBaselineManager:
         finally:
             if os.path.exists(baseline_path):
                 os.unlink(baseline_path)
+
+    def test_read_baseline_cached(self, sample_hardware):
+        """Test that repeated reads reuse the parsed tree until the file changes."""
+        from kerf.models import GlobalDeviceTree
+
+        with tempfile.NamedTemporaryFile(delete=False) as f:
+            baseline_path = f.name
+
+        try:
+            tree = GlobalDeviceTree(hardware=sample_hardware, instances={}, device_references={})
+
+            manager = BaselineManager(baseline_path=baseline_path)
+            manager.write_baseline(tree)
+
+            first = manager.read_baseline()
+            assert manager.read_baseline() is first
+
+            manager.clear_cache()
+            assert manager.read_baseline() is not first
+        finally:
+            if os.path.exists(baseline_path):
+                os.unlink(baseline_path)
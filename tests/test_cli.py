@@ -0,0 +1,49 @@
+# Copyright 2025 Multikernel Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests for the kerf command-line entry point.
+"""
+
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+import kerf
+from kerf.cli import main
+
+
+class TestVersionOption:
+    """Test the --version option."""
+
+    def test_version_matches_package(self):
+        """Test --version reports kerf.__version__."""
+        result = CliRunner().invoke(main, ["--version"])
+
+        assert result.exit_code == 0
+        assert result.output == f"kerf, version {kerf.__version__}\n"
+
+    def test_version_without_metadata(self):
+        """Test --version falls back to the local version in a source tree."""
+        from importlib.metadata import PackageNotFoundError
+
+        with patch.dict(kerf.__dict__), patch(
+            "importlib.metadata.version", side_effect=PackageNotFoundError("kerf")
+        ):
+            kerf.__dict__.pop("__version__", None)
+            result = CliRunner().invoke(main, ["--version"])
+
+        assert result.exit_code == 0
+        assert result.output == "kerf, version 0.0.0+local\n"
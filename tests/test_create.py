@@ -0,0 +1,172 @@
+# Copyright 2025 Multikernel Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for kerf create command helpers.
+"""
+
+import pytest
+
+from kerf.create.main import (
+    allocate_cpus_from_pool,
+    parse_cpu_spec,
+    parse_memory_base,
+    parse_memory_spec,
+    parse_numa_nodes,
+)
+from kerf.exceptions import ResourceError
+from kerf.models import GlobalDeviceTree, NUMANode, TopologySection
+
+
+def _numa_tree(hardware, instances=None):
+    """Build a tree whose 28 available CPUs (4-31) are split over two NUMA nodes."""
+    hardware.topology = TopologySection(
+        numa_nodes={
+            0: NUMANode(0, 0x80000000, 7 * 1024**3, list(range(0, 16)), {0: 10, 1: 20}, "dram"),
+            1: NUMANode(1, 0x200000000, 7 * 1024**3, list(range(16, 32)), {0: 20, 1: 10}, "dram"),
+        }
+    )
+    return GlobalDeviceTree(hardware=hardware, instances=instances or {}, device_references={})
+
+
+class TestParseSpecs:
+    """Test CPU and memory specification parsing."""
+
+    def test_parse_cpu_spec(self):
+        """Test single IDs, ranges and mixed lists."""
+        assert parse_cpu_spec("4") == [4]
+        assert parse_cpu_spec("4-7") == [4, 5, 6, 7]
+        assert parse_cpu_spec(" 7, 4-5 ,5") == [4, 5, 7]
+        assert parse_cpu_spec("4 - 6,10") == [4, 5, 6, 10]
+
+    @pytest.mark.parametrize("spec", ["", "a", "4-", "7-4", "4,,5", "4-5-6", "-1"])
+    def test_parse_cpu_spec_invalid(self, spec):
+        """Test malformed CPU specifications are rejected."""
+        with pytest.raises(ValueError):
+            parse_cpu_spec(spec)
+
+    def test_parse_memory_spec(self):
+        """Test memory sizes with and without units."""
+        assert parse_memory_spec("2GB") == 2 * 1024**3
+        assert parse_memory_spec("512mb") == 512 * 1024**2
+        assert parse_memory_spec("1.5KB") == 1536
+        assert parse_memory_spec(" 1 TB ") == 1024**4
+        assert parse_memory_spec("4096") == 4096
+
+    @pytest.mark.parametrize("spec", ["", "GB", "xMB", "12XB", "1.5"])
+    def test_parse_memory_spec_invalid(self, spec):
+        """Test malformed memory specifications are rejected."""
+        with pytest.raises(ValueError):
+            parse_memory_spec(spec)
+
+    def test_parse_memory_base(self):
+        """Test hexadecimal and decimal base addresses."""
+        assert parse_memory_base("0x80000000") == 0x80000000
+        assert parse_memory_base("0XFF") == 0xFF
+        assert parse_memory_base(" 4096 ") == 4096
+
+    @pytest.mark.parametrize("spec", ["", "0x", "0xZZ", "12a"])
+    def test_parse_memory_base_invalid(self, spec):
+        """Test malformed base addresses are rejected."""
+        with pytest.raises(ValueError):
+            parse_memory_base(spec)
+
+    def test_parse_numa_nodes(self):
+        """Test NUMA node lists keep their order and skip empty items."""
+        assert parse_numa_nodes("0") == [0]
+        assert parse_numa_nodes("1, 0") == [1, 0]
+        assert parse_numa_nodes("0,,1,") == [0, 1]
+        assert parse_numa_nodes(" , ") == []
+
+        with pytest.raises(ValueError):
+            parse_numa_nodes("0 1")
+
+
+class TestAllocateCpus:
+    """Test automatic CPU allocation policies."""
+
+    def test_compact_without_topology(self, sample_tree):
+        """Test compact allocation picks the first consecutive run."""
+        # web-server uses 4-7 and database uses 8-15
+        assert allocate_cpus_from_pool(sample_tree, 4) == [16, 17, 18, 19]
+
+    def test_compact_skips_gaps(self, sample_hardware):
+        """Test compact allocation skips runs that are too short."""
+        sample_hardware.cpus.available = [4, 5, 7, 8, 9, 10, 12]
+        tree = GlobalDeviceTree(hardware=sample_hardware, instances={}, device_references={})
+
+        assert allocate_cpus_from_pool(tree, 3) == [7, 8, 9]
+        assert allocate_cpus_from_pool(tree, 5) == [4, 5, 7, 8, 9]
+
+    def test_compact_numa_node(self, sample_hardware):
+        """Test compact allocation restricted to a NUMA node."""
+        tree = _numa_tree(sample_hardware)
+
+        assert allocate_cpus_from_pool(tree, 2, numa_nodes=[1]) == [16, 17]
+
+    def test_spread_without_topology(self, sample_hardware):
+        """Test spread allocation spaces CPUs across the pool."""
+        tree = GlobalDeviceTree(hardware=sample_hardware, instances={}, device_references={})
+
+        assert allocate_cpus_from_pool(tree, 1, cpu_affinity="spread") == [4]
+        assert allocate_cpus_from_pool(tree, 4, cpu_affinity="spread") == [4, 13, 22, 31]
+
+    def test_spread_numa_nodes(self, sample_hardware):
+        """Test spread allocation round-robins across NUMA nodes."""
+        tree = _numa_tree(sample_hardware)
+
+        cpus = allocate_cpus_from_pool(tree, 4, cpu_affinity="spread", numa_nodes=[0, 1])
+        assert cpus == [4, 5, 16, 17]
+
+        # Node 0 has only 12 available CPUs; the rest come from node 1
+        cpus = allocate_cpus_from_pool(tree, 26, cpu_affinity="spread", numa_nodes=[0, 1])
+        assert cpus == list(range(4, 30))
+
+    def test_local(self, sample_hardware):
+        """Test local allocation stays within one NUMA node."""
+        tree = _numa_tree(sample_hardware)
+
+        assert allocate_cpus_from_pool(tree, 14, cpu_affinity="local") == list(range(16, 30))
+        assert allocate_cpus_from_pool(tree, 3, cpu_affinity="local", numa_nodes=[0]) == [4, 5, 6]
+
+    def test_local_requires_topology(self, sample_tree):
+        """Test local allocation fails without NUMA topology."""
+        with pytest.raises(ResourceError, match="requires NUMA topology"):
+            allocate_cpus_from_pool(sample_tree, 2, cpu_affinity="local")
+
+    def test_not_enough_cpus(self, sample_hardware):
+        """Test allocation fails when the pool is too small."""
+        tree = _numa_tree(sample_hardware)
+
+        with pytest.raises(ResourceError, match="Not enough APIC IDs"):
+            allocate_cpus_from_pool(tree, 13, numa_nodes=[0])
+        with pytest.raises(ResourceError, match="Not enough APIC IDs"):
+            allocate_cpus_from_pool(tree, 29)
+
+    def test_numa_nodes_without_cpu_map(self, sample_hardware):
+        """Test a NUMA node request fails when the topology lists no node CPUs."""
+        sample_hardware.topology = TopologySection(
+            numa_nodes={0: NUMANode(0, 0x80000000, 14 * 1024**3, [], {0: 10}, "dram")}
+        )
+        tree = GlobalDeviceTree(hardware=sample_hardware, instances={}, device_references={})
+
+        with pytest.raises(ResourceError, match="does not list the CPUs"):
+            allocate_cpus_from_pool(tree, 2, numa_nodes=[0])
+
+    def test_take_all(self, sample_hardware):
+        """Test requesting every available CPU."""
+        tree = _numa_tree(sample_hardware)
+
+        for affinity in ("compact", "spread"):
+            assert allocate_cpus_from_pool(tree, 28, cpu_affinity=affinity) == list(range(4, 32))
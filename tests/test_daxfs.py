@@ -0,0 +1,86 @@
+# Copyright 2025 Multikernel Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""
+Tests for the daxfs image builder.
+"""
+
+import mmap
+import os
+
+import pytest
+
+from kerf.daxfs.mkdaxfs import DaxfsBuilder, DaxfsError
+
+
+def _build_image(src_dir, fill, before_write=None):
+    """Build an image of src_dir into a buffer prefilled with fill."""
+    builder = DaxfsBuilder(str(src_dir), overlay_pool_size=64 * 1024)
+    builder.scan()
+    builder.build_tree()
+    builder.calculate_offsets()
+    if before_write:
+        before_write()
+
+    size = builder.calculate_total_size() + 2 * 4096
+    mem = mmap.mmap(-1, size)
+    try:
+        mem.write(fill * size)
+        builder.write_image(mem, size)
+        return bytes(mem)
+    finally:
+        mem.close()
+
+
+class TestDaxfsBuilder:
+    """Test daxfs image generation."""
+
+    def test_write_image_clears_stale_memory(self, tmp_path):
+        """Test leftover data in a reused buffer does not leak into the image."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "file.txt").write_bytes(b"hello")
+        (tmp_path / "data.bin").write_bytes(bytes(range(256)) * 20)
+        os.symlink("sub/file.txt", tmp_path / "link")
+
+        clean = _build_image(tmp_path, b"\0")
+        stale = _build_image(tmp_path, b"\xff")
+
+        assert stale == clean
+
+    def test_write_image_clears_short_read_tail(self, tmp_path):
+        """Test a file that shrank after scanning leaves zeros, not stale data."""
+        data = tmp_path / "data.bin"
+        data.write_bytes(b"x" * 6000)
+
+        def shrink():
+            data.write_bytes(b"x" * 100)
+
+        clean = _build_image(tmp_path, b"\0", shrink)
+        data.write_bytes(b"x" * 6000)
+        stale = _build_image(tmp_path, b"\xff", shrink)
+
+        assert stale == clean
+
+    def test_total_size_requires_offsets(self, tmp_path):
+        """Test the image size is not reported before offsets are calculated."""
+        builder = DaxfsBuilder(str(tmp_path))
+        builder.scan()
+        builder.build_tree()
+
+        with pytest.raises(DaxfsError, match="calculate_offsets"):
+            builder.calculate_total_size()
+
+        builder.calculate_offsets()
+        assert builder.calculate_total_size() == builder.total_size > 0
@@ -0,0 +1,73 @@
+# Copyright 2025 Multikernel Technologies, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for kerf package import behavior.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_PATH = str(Path(__file__).parent.parent / "src")
+
+
+def _modules_after(statement):
+    """Return the kerf modules loaded in a fresh interpreter after running statement."""
+    code = (
+        f"import sys; sys.path.insert(0, {SRC_PATH!r}); {statement}; "
+        "print('\\n'.join(m for m in sys.modules if m.startswith('kerf')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports:
+    """Test that importing kerf does not load heavy submodules."""
+
+    def test_import_kerf_skips_dtc(self):
+        """Test that 'import kerf' does not load the device tree parser."""
+        modules = _modules_after("import kerf")
+
+        assert "kerf" in modules
+        assert "kerf.dtc.parser" not in modules
+
+    def test_import_dtc_submodule_skips_siblings(self):
+        """Test that importing one dtc submodule does not load the others."""
+        modules = _modules_after("import kerf.dtc.overlay")
+
+        assert "kerf.dtc.overlay" in modules
+        assert "kerf.dtc.parser" not in modules
+        assert "kerf.dtc.extractor" not in modules
+
+    def test_dtc_lazy_attribute_access(self):
+        """Test that kerf.dtc names resolve on first access."""
+        import kerf.dtc
+        from kerf.dtc.parser import DeviceTreeParser
+
+        assert kerf.dtc.DeviceTreeParser is DeviceTreeParser
+        for name in kerf.dtc.__all__:
+            assert getattr(kerf.dtc, name) is not None
+
+    def test_lazy_attribute_access(self):
+        """Test that public names resolve on first access."""
+        import kerf
+        from kerf.baseline import BaselineManager
+
+        assert kerf.BaselineManager is BaselineManager
+        assert "BaselineManager" in dir(kerf)
+        for name in kerf.__all__:
+            assert getattr(kerf, name) is not None
@@ -243,6 +243,7 @@ class TestTopology:
         assert topology.get_numa_node_for_cpu(0) == 0
         assert topology.get_numa_node_for_cpu(5) == 1
         assert topology.get_numa_node_for_cpu(999) is None
+        assert topology.numa_node_of_cpu == {0: 0, 1: 0, 2: 0, 3: 0, 4: 1, 5: 1, 6: 1, 7: 1}
 
     def test_topology_section_get_memory_region_for_numa_node(self):
         """Test getting memory region for NUMA node."""
@@ -268,6 +269,17 @@ class TestTopology:
         assert region is None
 
 
+class TestGlobalDeviceTree:
+    """Test GlobalDeviceTree model."""
+
+    def test_instance_names_by_id(self, sample_tree):
+        """Test the ID -> name map follows changes to the instances."""
+        assert sample_tree.instance_names_by_id() == {1: "web-server", 2: "database"}
+
+        del sample_tree.instances["database"]
+        assert sample_tree.instance_names_by_id() == {1: "web-server"}
+
+
 class TestWorkloadType:
     """Test workload type enum."""
 
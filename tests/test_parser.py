@@ -160,3 +160,45 @@ class TestInstanceExtractor:
 
         assert len(parsed_tree.instances) == 3
         assert "test" in parsed_tree.instances
+
+    def test_generate_dtb_reuses_extractor(self, sample_tree, sample_hardware):
+        """Test an extractor produces the same DTBs when reused across trees."""
+        from kerf.models import GlobalDeviceTree
+
+        small_tree = GlobalDeviceTree(hardware=sample_hardware, instances={}, device_references={})
+        expected_large = InstanceExtractor().generate_global_dtb(sample_tree)
+        expected_small = InstanceExtractor().generate_global_dtb(small_tree)
+
+        extractor = InstanceExtractor()
+        assert extractor.generate_global_dtb(sample_tree) == expected_large
+        assert extractor.generate_global_dtb(small_tree) == expected_small
+        assert extractor.generate_global_dtb(sample_tree) == expected_large
+
+    def test_generate_dtb_device_references(self, sample_hardware):
+        """Test dict and attribute-style device references emit the same properties."""
+        from types import SimpleNamespace
+
+        import libfdt
+
+        from kerf.models import GlobalDeviceTree
+
+        refs = {
+            "eth0_vf1": {"parent": "eth0", "vf_id": 1},
+            "nvme0_ns2": SimpleNamespace(parent="nvme0", vf_id=None, namespace_id=2),
+            "eth0_vf0": {"parent": "", "vf_id": 0},
+        }
+        tree = GlobalDeviceTree(hardware=sample_hardware, instances={}, device_references=refs)
+        fdt = libfdt.Fdt(InstanceExtractor().generate_global_dtb(tree))
+
+        vf1 = fdt.path_offset("/eth0_vf1")
+        assert fdt.getprop(vf1, "parent").as_str() == "eth0"
+        assert fdt.getprop(vf1, "vf-id").as_uint32() == 1
+
+        ns2 = fdt.path_offset("/nvme0_ns2")
+        assert fdt.getprop(ns2, "parent").as_str() == "nvme0"
+        assert fdt.getprop(ns2, "namespace-id").as_uint32() == 2
+        assert fdt.getprop(ns2, "vf-id", libfdt.QUIET_NOTFOUND) == -libfdt.NOTFOUND
+
+        vf0 = fdt.path_offset("/eth0_vf0")
+        assert fdt.getprop(vf0, "parent", libfdt.QUIET_NOTFOUND) == -libfdt.NOTFOUND
+        assert fdt.getprop(vf0, "vf-id").as_uint32() == 0
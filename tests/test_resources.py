@@ -130,6 +130,23 @@ class TestMemoryAllocation:
         # Should return None
         assert base is None
 
+    def test_find_available_memory_base_nested_regions(self, sample_hardware):
+        """Test a region nested inside another does not expose a false gap."""
+        from unittest.mock import patch
+
+        from kerf.models import GlobalDeviceTree
+
+        tree = GlobalDeviceTree(hardware=sample_hardware, instances={}, device_references={})
+        regions = [
+            (0x80000000, 4 * 1024**3),  # 0x80000000-0x17fffffff
+            (0x90000000, 0x1000),  # nested in the region above
+        ]
+
+        with patch("kerf.resources.get_allocated_memory_regions_from_iomem", return_value=regions):
+            base = find_available_memory_base(tree, 1024**3)
+
+        assert base == 0x180000000
+
     def test_validate_memory_allocation_success(self, sample_tree):
         """Test successful memory allocation validation."""
         # Use a region that's not allocated (after database region)
@@ -206,6 +223,22 @@ class TestInstanceID:
         next_id = find_next_instance_id(sample_tree)
         assert next_id == 1
 
+    def test_find_next_instance_id_after_add(self, sample_hardware):
+        """Test an ID is not handed out again once an instance uses it."""
+        from kerf.models import GlobalDeviceTree, Instance, InstanceResources
+
+        tree = GlobalDeviceTree(hardware=sample_hardware, instances={}, device_references={})
+        assert find_next_instance_id(tree) == 1
+
+        tree.instances["first"] = Instance(
+            name="first",
+            id=1,
+            resources=InstanceResources(
+                cpus=[4], memory_base=0x80000000, memory_bytes=0x1000000, devices=[]
+            ),
+        )
+        assert find_next_instance_id(tree) == 2
+
     def test_find_next_instance_id_full(self, sample_hardware):
         """Test when all IDs are exhausted."""
         from kerf.models import GlobalDeviceTree, Instance, InstanceResources
@@ -84,19 +84,17 @@ class TestDeviceTreeManager:
             assert not names
 
     @patch("pathlib.Path.is_dir")
-    @patch("pathlib.Path.exists")
-    def test_has_instance(self, mock_exists, mock_is_dir):
+    def test_has_instance(self, mock_is_dir):
         """Test checking if instance exists."""
         manager = DeviceTreeManager()
 
         # Mock instance directory exists and is a directory
-        mock_exists.return_value = True
         mock_is_dir.return_value = True
         result = manager.has_instance("test-instance")
         assert result is True
 
         # Mock instance directory doesn't exist
-        mock_exists.return_value = False
+        mock_is_dir.return_value = False
         result = manager.has_instance("nonexistent")
         assert result is False
 